@@ -1,15 +1,19 @@
 """Puzzle Game Online integration for Home Assistant."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import partial
+from importlib.resources import files
+import inspect
 import logging
-from pathlib import Path
+import os
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.components import frontend, websocket_api
 from homeassistant.components.http import StaticPathConfig
@@ -18,8 +22,6 @@ from .const import (
     DOMAIN,
     VERSION,
     CONF_API_KEY,
-    CONF_DISPLAY_NAME,
-    PANEL_URL,
     PANEL_TITLE,
     PANEL_ICON,
     SERVICE_START_GAME,
@@ -44,6 +46,100 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+# Path to the bundled panel, resolved once at import
+_PANEL_PATH = str(files(__package__) / "frontend" / "panel.js")
+
+# Service schemas (built once at import)
+_SCHEMA_START_GAME = vol.Schema({vol.Optional("bonus", default=False): cv.boolean})
+_SCHEMA_SUBMIT_ANSWER = vol.Schema({vol.Required("answer"): cv.string})
+_SCHEMA_ADD_LETTER = vol.All(
+    vol.Schema({
+        vol.Exclusive("letter", "letters"): cv.string,
+        vol.Exclusive("letters", "letters"): vol.All(cv.ensure_list, [cv.string]),
+    }),
+    cv.has_at_least_one_key("letter", "letters"),
+)
+_SCHEMA_FINISH_SPELLING = vol.Schema({vol.Optional("text"): cv.string})
+_SCHEMA_SET_WAGER = vol.Schema(
+    {vol.Required("points"): vol.All(vol.Coerce(int), vol.Range(min=-1))}
+)
+_SCHEMA_SET_SESSION = vol.Schema({
+    vol.Required("active"): cv.boolean,
+    vol.Optional("satellite"): cv.string,
+    vol.Optional("view_assist_device"): cv.string,
+})
+
+
+def _wager_args(call: ServiceCall) -> tuple[int]:
+    """Extract the wager points from a set_wager call."""
+    points = call.data.get("points", 0)
+    # -1 means "all in" - wager the full score
+    if points == -1:
+        points = 9999  # Will be clamped to current_score in game_manager
+    return (points,)
+
+
+# service -> (coordinator method, result event, schema, argument extractor,
+#             supports response)
+_SERVICES: dict[str, tuple] = {
+    SERVICE_START_GAME: (
+        "async_start_game", "game_started",
+        _SCHEMA_START_GAME,
+        lambda call: (call.data.get("bonus", False),),
+        True,
+    ),
+    SERVICE_SUBMIT_ANSWER: (
+        "async_submit_answer", "answer_submitted",
+        _SCHEMA_SUBMIT_ANSWER,
+        lambda call: (call.data.get("answer", ""),),
+        False,
+    ),
+    SERVICE_REVEAL_LETTER: (
+        "async_reveal_letter", "letter_revealed", None, None, False,
+    ),
+    SERVICE_SKIP_WORD: ("async_skip_word", "word_skipped", None, None, False),
+    SERVICE_REPEAT_CLUE: ("repeat_clue", "clue_repeated", None, None, False),
+    SERVICE_START_SPELLING: (
+        "async_start_spelling", "spelling_started", None, None, False,
+    ),
+    SERVICE_ADD_LETTER: (
+        "async_add_letters", "letter_added",
+        _SCHEMA_ADD_LETTER,
+        lambda call: (call.data.get("letters") or [call.data["letter"]],),
+        False,
+    ),
+    SERVICE_FINISH_SPELLING: (
+        "async_finish_spelling", "spelling_finished",
+        _SCHEMA_FINISH_SPELLING,
+        lambda call: (call.data.get("text"),),
+        False,
+    ),
+    SERVICE_CANCEL_SPELLING: (
+        "async_cancel_spelling", "spelling_cancelled", None, None, False,
+    ),
+    SERVICE_GIVE_UP: ("async_give_up", "game_ended", None, None, False),
+    SERVICE_SET_WAGER: (
+        "async_set_wager", "wager_set",
+        _SCHEMA_SET_WAGER,
+        _wager_args,
+        False,
+    ),
+    SERVICE_SET_SESSION: (
+        "set_session", None,
+        _SCHEMA_SET_SESSION,
+        lambda call: (
+            call.data.get("active", False),
+            call.data.get("satellite"),
+            call.data.get("view_assist_device"),
+        ),
+        False,
+    ),
+    SERVICE_LISTENING_TIMEOUT: (
+        "async_handle_timeout", "timeout", None, None, True,
+    ),
+    SERVICE_RESET_TIMEOUT: ("reset_timeout", None, None, None, False),
+}
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Puzzle Game Online from a config entry."""
@@ -55,16 +151,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         timezone=hass.config.time_zone,
     )
 
-    # Validate API connection by checking user stats (uses API key auth)
-    try:
-        await api.get_my_stats()
-    except Exception as err:
-        _LOGGER.error("Failed to connect to API: %s", err)
+    # Only check the API is reachable here; the API key is validated in the
+    # background so setup does not wait on an authenticated round-trip
+    if not await api.check_health():
+        _LOGGER.error("Failed to connect to API")
         await api.close()
         return False
 
     # Create coordinator
     coordinator = PuzzleGameCoordinator(hass, api)
+    entry.async_create_background_task(
+        hass,
+        coordinator.async_validate_auth(entry),
+        f"{DOMAIN}_validate_auth",
+        eager_start=True,
+    )
 
     # Store references
     hass.data[DOMAIN][entry.entry_id] = {
@@ -99,27 +200,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await data["api"].close()
 
         # Remove panel if no more entries
-        if not hass.data[DOMAIN]:
-            frontend.async_remove_panel(hass, DOMAIN)
+        if not any(not key.startswith("_") for key in hass.data[DOMAIN]):
+            if hass.data[DOMAIN].pop("_panel_registered", False):
+                frontend.async_remove_panel(hass, DOMAIN)
 
     return unload_ok
 
 
 async def _async_register_panel(hass: HomeAssistant) -> None:
     """Register the frontend panel."""
-    # Get path to panel.js
-    panel_path = Path(__file__).parent / "frontend" / "panel.js"
+    if hass.data[DOMAIN].get("_panel_registered"):
+        return
 
-    if not panel_path.exists():
-        _LOGGER.warning("Panel file not found: %s", panel_path)
+    if not await hass.async_add_executor_job(os.path.exists, _PANEL_PATH):
+        _LOGGER.warning("Panel file not found: %s", _PANEL_PATH)
         return
 
-    # Register static path
+    # Register static path (survives panel removal, so only do it once)
     panel_url = f"/puzzle_game_online/panel-{VERSION}.js"
 
-    await hass.http.async_register_static_paths([
-        StaticPathConfig(panel_url, str(panel_path), cache_headers=True)
-    ])
+    if not hass.data[DOMAIN].get("_static_registered"):
+        await hass.http.async_register_static_paths([
+            StaticPathConfig(panel_url, _PANEL_PATH, cache_headers=True)
+        ])
+        hass.data[DOMAIN]["_static_registered"] = True
 
     # Register panel
     frontend.async_register_built_in_panel(
@@ -136,168 +240,73 @@ async def _async_register_panel(hass: HomeAssistant) -> None:
         },
         require_admin=False,
     )
+    hass.data[DOMAIN]["_panel_registered"] = True
 
 
 async def _async_setup_services(
     hass: HomeAssistant, coordinator: PuzzleGameCoordinator
 ) -> None:
     """Set up services."""
-
-    async def handle_start_game(call: ServiceCall) -> dict[str, Any]:
-        """Handle start game service."""
-        is_bonus = call.data.get("bonus", False)
-        result = await coordinator.async_start_game(is_bonus)
-        _fire_result_event(hass, "game_started", result)
-        return result
-
-    async def handle_submit_answer(call: ServiceCall) -> None:
-        """Handle submit answer service."""
-        answer = call.data.get("answer", "")
-        result = await coordinator.async_submit_answer(answer)
-        _fire_result_event(hass, "answer_submitted", result)
-
-    async def handle_reveal_letter(call: ServiceCall) -> None:
-        """Handle reveal letter service."""
-        result = await coordinator.async_reveal_letter()
-        _fire_result_event(hass, "letter_revealed", result)
-
-    async def handle_skip_word(call: ServiceCall) -> None:
-        """Handle skip word service."""
-        result = coordinator.skip_word()
-        _fire_result_event(hass, "word_skipped", result)
-
-    async def handle_repeat_clue(call: ServiceCall) -> None:
-        """Handle repeat clue service."""
-        result = coordinator.repeat_clue()
-        _fire_result_event(hass, "clue_repeated", result)
-
-    async def handle_start_spelling(call: ServiceCall) -> None:
-        """Handle start spelling service."""
-        result = coordinator.start_spelling()
-        _fire_result_event(hass, "spelling_started", result)
-
-    async def handle_add_letter(call: ServiceCall) -> None:
-        """Handle add letter service."""
-        letter = call.data.get("letter", "")
-        result = coordinator.add_letter(letter)
-        _fire_result_event(hass, "letter_added", result)
-
-    async def handle_finish_spelling(call: ServiceCall) -> None:
-        """Handle finish spelling service."""
-        text = call.data.get("text")
-        result = await coordinator.async_finish_spelling(text)
-        _fire_result_event(hass, "spelling_finished", result)
-
-    async def handle_cancel_spelling(call: ServiceCall) -> None:
-        """Handle cancel spelling service."""
-        result = coordinator.cancel_spelling()
-        _fire_result_event(hass, "spelling_cancelled", result)
-
-    async def handle_give_up(call: ServiceCall) -> None:
-        """Handle give up service."""
-        result = await coordinator.async_give_up()
-        _fire_result_event(hass, "game_ended", result)
-
-    async def handle_set_wager(call: ServiceCall) -> None:
-        """Handle set wager service."""
-        points = call.data.get("points", 0)
-        # -1 means "all in" - wager the full score
-        if points == -1:
-            points = 9999  # Will be clamped to current_score in game_manager
-        result = coordinator.set_wager(points)
-        _fire_result_event(hass, "wager_set", result)
-
-    async def handle_set_session(call: ServiceCall) -> None:
-        """Handle set session service."""
-        coordinator.set_session(
-            active=call.data.get("active", False),
-            satellite=call.data.get("satellite"),
-            view_assist_device=call.data.get("view_assist_device"),
-        )
-
-    async def handle_listening_timeout(call: ServiceCall) -> dict[str, Any]:
-        """Handle listening timeout service."""
-        result = coordinator.handle_timeout()
-        _fire_result_event(hass, "timeout", result)
-        return result
-
-    async def handle_reset_timeout(call: ServiceCall) -> None:
-        """Handle reset timeout service."""
-        coordinator.reset_timeout()
-
     # Register all services
-    hass.services.async_register(
-        DOMAIN, SERVICE_START_GAME, handle_start_game,
-        schema=vol.Schema({vol.Optional("bonus", default=False): cv.boolean}),
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_SUBMIT_ANSWER, handle_submit_answer,
-        schema=vol.Schema({vol.Required("answer"): cv.string}),
-    )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_REVEAL_LETTER, handle_reveal_letter,
-    )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_SKIP_WORD, handle_skip_word,
-    )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_REPEAT_CLUE, handle_repeat_clue,
-    )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_START_SPELLING, handle_start_spelling,
-    )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_ADD_LETTER, handle_add_letter,
-        schema=vol.Schema({vol.Required("letter"): cv.string}),
-    )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_FINISH_SPELLING, handle_finish_spelling,
-        schema=vol.Schema({vol.Optional("text"): cv.string}),
-    )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_CANCEL_SPELLING, handle_cancel_spelling,
-    )
+    for service, (method_name, event_type, schema, extractor, response) in _SERVICES.items():
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            partial(
+                _async_handle_service,
+                hass, coordinator, method_name, event_type, extractor, response,
+            ),
+            schema=schema,
+            supports_response=(
+                SupportsResponse.OPTIONAL if response else SupportsResponse.NONE
+            ),
+        )
 
-    hass.services.async_register(
-        DOMAIN, SERVICE_GIVE_UP, handle_give_up,
-    )
 
-    hass.services.async_register(
-        DOMAIN, SERVICE_SET_WAGER, handle_set_wager,
-        schema=vol.Schema({vol.Required("points"): vol.All(vol.Coerce(int), vol.Range(min=-1))}),
-    )
+async def _async_handle_service(
+    hass: HomeAssistant,
+    coordinator: PuzzleGameCoordinator,
+    method_name: str,
+    event_type: str | None,
+    extractor: Callable[[ServiceCall], tuple] | None,
+    return_response: bool,
+    call: ServiceCall,
+) -> dict[str, Any] | None:
+    """Handle a puzzle game service call by calling a coordinator method."""
+    args = extractor(call) if extractor else ()
+    result = getattr(coordinator, method_name)(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    if event_type:
+        _fire_result_event(hass, event_type, result)
+    return result if return_response else None
 
-    hass.services.async_register(
-        DOMAIN, SERVICE_SET_SESSION, handle_set_session,
-        schema=vol.Schema({
-            vol.Required("active"): cv.boolean,
-            vol.Optional("satellite"): cv.string,
-            vol.Optional("view_assist_device"): cv.string,
-        }),
-    )
 
-    hass.services.async_register(
-        DOMAIN, SERVICE_LISTENING_TIMEOUT, handle_listening_timeout,
-        supports_response=SupportsResponse.OPTIONAL,
+def _fire_result_event(hass: HomeAssistant, event_type: str, data: dict[str, Any]) -> None:
+    """Queue an event with result data, fired on the next loop iteration.
+
+    Every result is fired, in order, with a sequence number so listeners
+    can tell the order of events that arrive together.
+    """
+    domain_data = hass.data[DOMAIN]
+    pending: list[tuple[str, dict[str, Any]]] = domain_data.setdefault(
+        "_pending_events", []
     )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_RESET_TIMEOUT, handle_reset_timeout,
+    if not pending:
+        hass.loop.call_soon(_flush_result_events, hass)
+    sequence = domain_data.get("_event_sequence", 0) + 1
+    domain_data["_event_sequence"] = sequence
+    pending.append((event_type, {**data, "sequence": sequence}))
+
+
+@callback
+def _flush_result_events(hass: HomeAssistant) -> None:
+    """Fire all queued result events."""
+    pending: list[tuple[str, dict[str, Any]]] = hass.data[DOMAIN].pop(
+        "_pending_events", []
     )
-
-
-def _fire_result_event(hass: HomeAssistant, event_type: str, data: dict[str, Any]) -> None:
-    """Fire an event with result data."""
-    hass.bus.async_fire(f"{DOMAIN}_{event_type}", data)
+    for event_type, data in pending:
+        hass.bus.async_fire(f"{DOMAIN}_{event_type}", data)
 
 
 def _async_register_websocket_commands(hass: HomeAssistant) -> None:
@@ -1,21 +1,77 @@
 """API client for Puzzle Game Online."""
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+import copy
+from datetime import datetime
 import logging
+import random
+import time
 from typing import Any
 import urllib.parse
+from zoneinfo import ZoneInfo
 
 import aiohttp
 from aiohttp import ClientTimeout
+from yarl import URL
 
 from .const import API_BASE_URL, API_TIMEOUT
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize request bodies with orjson."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    import json
+
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 _LOGGER = logging.getLogger(__name__)
 
+_BASE_URL = URL(API_BASE_URL)
+_TIMEOUT = ClientTimeout(total=API_TIMEOUT)
+
+# Fixed endpoints, parsed once at import
+_URL_REGISTER_DEVICE = _BASE_URL / "auth" / "register-device"
+_URL_CHECK_AVAILABILITY = _BASE_URL / "auth" / "check-availability"
+_URL_DAILY_PUZZLE = _BASE_URL / "puzzle" / "daily"
+_URL_BONUS_PUZZLE = _BASE_URL / "puzzle" / "bonus"
+_URL_SUBMIT_SCORE = _BASE_URL / "score" / "submit"
+_URL_USER_STATS = _BASE_URL / "user" / "stats"
+_URL_USER_HISTORY = _BASE_URL / "user" / "history"
+_URL_USER_PROFILE = _BASE_URL / "user" / "profile"
+_URL_HEALTH = _BASE_URL / "health"
+
+# Maximum number of GET responses kept for conditional requests
+ETAG_CACHE_SIZE = 64
+
+# Retry policy for rate limits and transient server errors
+RETRY_ATTEMPTS = 3
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_MAX_DELAY = 2  # seconds
+# Total time a request may spend waiting to retry; game actions hold the
+# coordinator's state lock while they wait, so keep this interactive
+RETRY_TIME_BUDGET = 5  # seconds
+
+# Puzzle payloads (clues and lengths) kept in memory between requests
+PUZZLE_CACHE_SIZE = 16
+PUZZLE_CACHE_TTL = 3600  # seconds
+
 
 class PuzzleGameAPIError(Exception):
     """Base exception for API errors."""
-    pass
+
+    def __init__(self, message: str = "", status: int | None = None) -> None:
+        """Initialize the error with the HTTP status, if there was a response."""
+        super().__init__(message)
+        self.status = status
 
 
 class PuzzleGameAuthError(PuzzleGameAPIError):
@@ -26,71 +82,301 @@ class PuzzleGameAuthError(PuzzleGameAPIError):
 class PuzzleGameAPI:
     """API client for Puzzle Game Online."""
 
-    def __init__(self, api_key: str | None = None, timezone: str | None = None) -> None:
-        """Initialize the API client."""
-        self._api_key = api_key
+    # Set once the server is known not to offer the availability lookup;
+    # shared because each config flow step creates its own client
+    _availability_unsupported = False
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        timezone: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        A session passed in is shared with its owner and is not closed by
+        close().
+        """
+        self._api_key: str | None = None
+        # Per-request headers, kept in sync with the API key
+        self._headers: dict[str, str] = {"Accept": "application/json"}
         self._timezone = timezone  # User's timezone from Home Assistant
-        self._session: aiohttp.ClientSession | None = None
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
+        # In-flight GET requests, so concurrent identical calls share one round-trip;
+        # a None result means the owner was cancelled before it finished
+        self._inflight: dict[tuple, asyncio.Future[dict[str, Any] | None]] = {}
+        # Validators and raw bodies of recent GET responses (LRU); bodies are
+        # parsed again on a hit so every caller gets its own objects
+        self._etag_cache: OrderedDict[tuple, tuple[str | None, str | None, bytes]] = OrderedDict()
+        # Path -> monotonic time of the last 429 response
+        self._rate_limited_at: dict[str, float] = {}
+        # Recently fetched puzzles: key -> (fetched at, puzzle)
+        self._puzzle_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        # Set once the server turns out to only accept answers in the URL path
+        self._legacy_answer_checks = False
+        self.api_key = api_key
 
     @property
     def api_key(self) -> str | None:
         """Return the API key."""
         return self._api_key
 
+    @api_key.setter
+    def api_key(self, api_key: str | None) -> None:
+        """Set the API key used for authenticated requests.
+
+        Responses cached for the previous key are dropped.
+        """
+        if api_key != self._api_key:
+            self._etag_cache.clear()
+            self._puzzle_cache.clear()
+        self._api_key = api_key
+        if api_key:
+            self._headers["X-API-Key"] = api_key
+        else:
+            self._headers.pop("X-API-Key", None)
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            timeout = ClientTimeout(total=API_TIMEOUT)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # Keep connections to the API alive between polls and cache DNS
+            connector = aiohttp.TCPConnector(
+                limit=8,
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=_TIMEOUT,
+                json_serialize=_json_dumps,
+            )
+            self._owns_session = True
         return self._session
 
     async def close(self) -> None:
         """Close the API session."""
-        if self._session and not self._session.closed:
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
             self._session = None
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers."""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        if self._api_key:
-            headers["X-API-Key"] = self._api_key
-        return headers
-
     async def _request(
         self,
         method: str,
-        endpoint: str,
+        endpoint: str | URL,
         data: dict | None = None,
         params: dict | None = None,
+        cacheable: bool = False,
+        idempotent: bool = True,
     ) -> dict[str, Any]:
-        """Make an API request."""
-        session = await self._get_session()
-        url = f"{API_BASE_URL}{endpoint}"
-        headers = self._get_headers()
+        """Make an API request.
 
+        Cacheable requests are read-only GETs: concurrent identical calls are
+        collapsed into a single one and repeats are sent as conditional GETs.
+        GETs that change server state pass idempotent=False so a server error
+        is not retried.
+        """
+        if not cacheable or method != "GET":
+            return await self._do_request(
+                method, endpoint, data, params, idempotent=idempotent
+            )
+
+        # Keyed by API key too, so responses never cross over to another user
+        key = (self._api_key, endpoint, tuple(sorted((params or {}).items())))
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            result = await asyncio.shield(inflight)
+            if result is not None:
+                # The owner keeps the original, callers may modify their copy
+                return copy.deepcopy(result)
+            # The caller that owned the request was cancelled; send it again
+            return await self._request(method, endpoint, data, params, cacheable=True)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            async with session.request(
-                method, url, json=data, params=params, headers=headers
-            ) as response:
-                if response.status == 401:
-                    raise PuzzleGameAuthError("Invalid or expired API key")
-                if response.status == 403:
-                    raise PuzzleGameAuthError("Access forbidden")
-
-                result = await response.json()
-
-                if response.status >= 400:
-                    error_detail = result.get("detail", str(result))
-                    raise PuzzleGameAPIError(f"API error: {error_detail}")
+            result = await self._do_request(method, endpoint, data, params, key)
+        except asyncio.CancelledError:
+            # Waiters were not cancelled themselves, None tells them to retry
+            future.set_result(None)
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            # Mark the exception as retrieved if nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _do_request(
+        self,
+        method: str,
+        endpoint: str | URL,
+        data: dict | None = None,
+        params: dict | None = None,
+        cache_key: tuple | None = None,
+        idempotent: bool = True,
+    ) -> dict[str, Any]:
+        """Perform a single HTTP request against the API.
 
-                return result
-        except aiohttp.ClientError as err:
-            _LOGGER.error("API request failed: %s", err)
-            raise PuzzleGameAPIError(f"Connection error: {err}") from err
+        When a cache_key is given the request is sent as a conditional GET
+        and a 304 response is answered from the cached body.
+        """
+        session = await self._get_session()
+        # Endpoints are either prebuilt URLs or paths relative to the API base
+        url = endpoint if isinstance(endpoint, URL) else f"{API_BASE_URL}{endpoint}"
+        headers = self._headers
+
+        cached = self._etag_cache.get(cache_key) if cache_key else None
+        if cached:
+            etag, last_modified, _ = cached
+            headers = dict(headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        delay = 0.0
+        deadline = time.monotonic() + RETRY_TIME_BUDGET
+        for attempt in range(RETRY_ATTEMPTS):
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                async with session.request(
+                    method, url, json=data, params=params, headers=headers,
+                    timeout=_TIMEOUT,
+                ) as response:
+                    if response.status == 401:
+                        raise PuzzleGameAuthError("Invalid or expired API key", 401)
+                    if response.status == 403:
+                        raise PuzzleGameAuthError("Access forbidden", 403)
+
+                    if response.status == 429:
+                        self._rate_limited_at[response.url.path] = time.monotonic()
+                    if self._should_retry(method, response.status, attempt, idempotent):
+                        delay = self._retry_delay(attempt, response)
+                        # Past the time budget the response is reported as is
+                        if time.monotonic() + delay < deadline:
+                            _LOGGER.debug(
+                                "API returned HTTP %s for %s, retrying in %.1fs",
+                                response.status, response.url.path, delay,
+                            )
+                            continue
+
+                    if response.status == 304 and cached:
+                        self._etag_cache.move_to_end(cache_key)
+                        return _json_loads(cached[2])
+
+                    # Nothing to parse for empty bodies
+                    if response.status == 204 or response.content_length == 0:
+                        if response.status >= 400:
+                            raise PuzzleGameAPIError(
+                                f"API error: HTTP {response.status}", response.status
+                            )
+                        return {}
+                    # A non-JSON body (e.g. a proxy error page) is never a valid result
+                    content_type = response.content_type
+                    if content_type != "application/json" and not content_type.endswith("+json"):
+                        text = await response.text()
+                        raise PuzzleGameAPIError(
+                            f"Unexpected response (HTTP {response.status}): {text[:200]}",
+                            response.status,
+                        )
+
+                    body = await response.read()
+                    try:
+                        result = _json_loads(body)
+                    except ValueError as err:
+                        raise PuzzleGameAPIError(
+                            f"Invalid response (HTTP {response.status})", response.status
+                        ) from err
+
+                    if response.status >= 400:
+                        error_detail = result.get("detail", str(result))
+                        raise PuzzleGameAPIError(
+                            f"API error: {error_detail}", response.status
+                        )
+
+                    if cache_key:
+                        self._store_cached_response(cache_key, response, body)
+
+                    return result
+            except aiohttp.ClientError as err:
+                _LOGGER.error("API request failed: %s", err)
+                raise PuzzleGameAPIError(f"Connection error: {err}") from err
+
+        raise PuzzleGameAPIError("API error: retries exhausted")
+
+    def _should_retry(
+        self, method: str, status: int, attempt: int, idempotent: bool = True
+    ) -> bool:
+        """Return whether a response status is worth retrying.
+
+        Rate limits are always retried; server errors only for idempotent
+        GETs, since a failed write may already have been applied.
+        """
+        if attempt >= RETRY_ATTEMPTS - 1 or status not in RETRY_STATUSES:
+            return False
+        return status == 429 or (method == "GET" and idempotent)
+
+    def _retry_delay(self, attempt: int, response: aiohttp.ClientResponse) -> float:
+        """Return the backoff delay before the next attempt."""
+        delay = min(2**attempt, RETRY_MAX_DELAY) + random.random() * 0.5
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        return delay
+
+    def rate_limited_at(self, path: str) -> float | None:
+        """Return when (monotonic time) an endpoint path was last rate limited."""
+        return self._rate_limited_at.get(path)
+
+    def _store_cached_response(
+        self, cache_key: tuple, response: aiohttp.ClientResponse, body: bytes
+    ) -> None:
+        """Remember a GET response if the server sent cache validators."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self._etag_cache.pop(cache_key, None)
+            return
+
+        self._etag_cache[cache_key] = (etag, last_modified, body)
+        self._etag_cache.move_to_end(cache_key)
+        while len(self._etag_cache) > ETAG_CACHE_SIZE:
+            self._etag_cache.popitem(last=False)
+
+    def _get_cached_puzzle(self, key: str) -> dict[str, Any] | None:
+        """Return a copy of a cached puzzle if it has not expired."""
+        cached = self._puzzle_cache.get(key)
+        if cached is None:
+            return None
+        fetched_at, puzzle = cached
+        if time.monotonic() - fetched_at >= PUZZLE_CACHE_TTL:
+            del self._puzzle_cache[key]
+            return None
+        self._puzzle_cache.move_to_end(key)
+        # The game keeps and modifies what it is given, the cache must not change
+        return copy.deepcopy(puzzle)
+
+    def _cache_puzzle(self, key: str, puzzle: dict[str, Any]) -> None:
+        """Store a puzzle, evicting the least recently used entry when full."""
+        self._puzzle_cache[key] = (time.monotonic(), copy.deepcopy(puzzle))
+        self._puzzle_cache.move_to_end(key)
+        while len(self._puzzle_cache) > PUZZLE_CACHE_SIZE:
+            self._puzzle_cache.popitem(last=False)
+
+    def _today(self) -> str:
+        """Return today's date (YYYY-MM-DD) in the user's timezone."""
+        try:
+            tz = ZoneInfo(self._timezone) if self._timezone else None
+        except (KeyError, ValueError):
+            tz = None
+        return datetime.now(tz).date().isoformat()
 
     # ==================== Authentication ====================
 
@@ -122,11 +408,34 @@ class PuzzleGameAPI:
         if device_info:
             data["device_info"] = device_info
 
-        result = await self._request("POST", "/auth/register-device", data=data)
+        result = await self._request("POST", _URL_REGISTER_DEVICE, data=data)
         # Store the API key for future requests
-        self._api_key = result.get("api_key")
+        self.api_key = result.get("api_key")
         return result
 
+    async def check_availability(self, username: str, email: str) -> dict[str, Any]:
+        """
+        Check whether a username and email can still be registered.
+
+        Returns:
+            {username_taken, email_taken}, or {} if the server has no such lookup
+        """
+        if PuzzleGameAPI._availability_unsupported:
+            return {}
+        try:
+            # Only a probe, so a server error is not worth a retry
+            return await self._request(
+                "GET",
+                _URL_CHECK_AVAILABILITY,
+                params={"username": username, "email": email},
+                idempotent=False,
+            )
+        except PuzzleGameAPIError as err:
+            if err.status not in (404, 405):
+                raise
+            PuzzleGameAPI._availability_unsupported = True
+            return {}
+
     # ==================== Puzzles ====================
 
     async def get_daily_puzzle(self, puzzle_date: str | None = None) -> dict[str, Any]:
@@ -139,12 +448,21 @@ class PuzzleGameAPI:
         Returns:
             {id, puzzle_date, difficulty, is_bonus, words: [{clue, length}]}
         """
+        # Keyed by date so the cached puzzle rolls over at local midnight
+        cache_key = f"daily:{puzzle_date or self._today()}"
+        if (cached := self._get_cached_puzzle(cache_key)) is not None:
+            return cached
+
         params = {}
         if puzzle_date:
             params["puzzle_date"] = puzzle_date
         if self._timezone:
             params["timezone"] = self._timezone
-        return await self._request("GET", "/puzzle/daily", params=params)
+        result = await self._request(
+            "GET", _URL_DAILY_PUZZLE, params=params, cacheable=True
+        )
+        self._cache_puzzle(cache_key, result)
+        return result
 
     async def get_bonus_puzzle(self) -> dict[str, Any]:
         """
@@ -153,11 +471,19 @@ class PuzzleGameAPI:
         Returns:
             {id, puzzle_date, difficulty, is_bonus, words: [{clue, length}]}
         """
-        return await self._request("GET", "/puzzle/bonus")
+        return await self._request("GET", _URL_BONUS_PUZZLE)
 
     async def get_puzzle_by_id(self, puzzle_id: str) -> dict[str, Any]:
         """Get a specific puzzle by ID."""
-        return await self._request("GET", f"/puzzle/{puzzle_id}")
+        cache_key = f"id:{puzzle_id}"
+        if (cached := self._get_cached_puzzle(cache_key)) is not None:
+            return cached
+
+        result = await self._request(
+            "GET", _BASE_URL / "puzzle" / puzzle_id, cacheable=True
+        )
+        self._cache_puzzle(cache_key, result)
+        return result
 
     async def start_game(self, puzzle_id: str) -> dict[str, Any]:
         """
@@ -166,7 +492,7 @@ class PuzzleGameAPI:
         Returns:
             {session_id, puzzle_id, status, reveals_available, solved_words, theme_solved}
         """
-        return await self._request("POST", f"/puzzle/{puzzle_id}/start")
+        return await self._request("POST", _BASE_URL / "puzzle" / puzzle_id / "start")
 
     async def get_session_status(self, puzzle_id: str) -> dict[str, Any]:
         """
@@ -176,7 +502,9 @@ class PuzzleGameAPI:
             {session_id, puzzle_id, status, reveals_used, reveals_available,
              revealed_letters, solved_words, theme_solved}
         """
-        return await self._request("GET", f"/puzzle/{puzzle_id}/session")
+        return await self._request(
+            "GET", _BASE_URL / "puzzle" / puzzle_id / "session", cacheable=True
+        )
 
     async def check_word(
         self, puzzle_id: str, word_index: int, answer: str
@@ -192,10 +520,11 @@ class PuzzleGameAPI:
         Returns:
             {correct, words_solved?, reveals_earned?, attempts_remaining?, already_solved?}
         """
-        # URL encode the answer to handle spaces and special characters
-        encoded_answer = urllib.parse.quote(answer, safe='')
-        return await self._request(
-            "GET", f"/puzzle/{puzzle_id}/check/{word_index}/{encoded_answer}"
+        # Answers go in the body so they are never part of a cacheable URL
+        return await self._check_answer(
+            _BASE_URL / "puzzle" / puzzle_id / "check",
+            {"word_index": word_index, "answer": answer},
+            f"/puzzle/{puzzle_id}/check/{word_index}/{urllib.parse.quote(answer, safe='')}",
         )
 
     async def check_theme(self, puzzle_id: str, answer: str) -> dict[str, Any]:
@@ -209,8 +538,28 @@ class PuzzleGameAPI:
         Returns:
             {correct, attempts_remaining?, already_solved?}
         """
-        encoded_answer = urllib.parse.quote(answer, safe='')
-        return await self._request("GET", f"/puzzle/{puzzle_id}/check-theme/{encoded_answer}")
+        return await self._check_answer(
+            _BASE_URL / "puzzle" / puzzle_id / "check-theme",
+            {"answer": answer},
+            f"/puzzle/{puzzle_id}/check-theme/{urllib.parse.quote(answer, safe='')}",
+        )
+
+    async def _check_answer(
+        self, endpoint: URL, data: dict, legacy_endpoint: str
+    ) -> dict[str, Any]:
+        """POST an answer, falling back to the GET path older servers expose."""
+        if not self._legacy_answer_checks:
+            try:
+                return await self._request("POST", endpoint, data=data)
+            except PuzzleGameAPIError as err:
+                if err.status not in (404, 405):
+                    raise
+                _LOGGER.debug("POST answer checks not supported, using the legacy path")
+
+        # A check uses up an attempt, so a server error is not retried
+        result = await self._request("GET", legacy_endpoint, idempotent=False)
+        self._legacy_answer_checks = True
+        return result
 
     async def reveal_letter(
         self, puzzle_id: str, word_index: int, letter_index: int
@@ -226,10 +575,12 @@ class PuzzleGameAPI:
         Returns:
             {letter, index, reveals_used, reveals_remaining, already_revealed?}
         """
+        # Spends a reveal, so a server error is not retried
         return await self._request(
             "GET",
-            f"/puzzle/{puzzle_id}/reveal/{word_index}",
+            _BASE_URL / "puzzle" / puzzle_id / "reveal" / str(word_index),
             params={"letter_index": letter_index},
+            idempotent=False,
         )
 
     # ==================== Scores ====================
@@ -267,11 +618,13 @@ class PuzzleGameAPI:
         if wager_percent > 0:
             data["wager_percent"] = wager_percent
 
-        return await self._request("POST", "/score/submit", data=data)
+        return await self._request("POST", _URL_SUBMIT_SCORE, data=data)
 
     async def get_my_score(self, puzzle_id: str) -> dict[str, Any]:
         """Get my score for a specific puzzle."""
-        return await self._request("GET", f"/score/puzzle/{puzzle_id}")
+        return await self._request(
+            "GET", _BASE_URL / "score" / "puzzle" / puzzle_id, cacheable=True
+        )
 
     # ==================== Leaderboard ====================
 
@@ -290,7 +643,10 @@ class PuzzleGameAPI:
              total_players, your_rank?, your_percentile?}
         """
         return await self._request(
-            "GET", f"/leaderboard/{period}", params={"limit": limit}
+            "GET",
+            _BASE_URL / "leaderboard" / period,
+            params={"limit": limit},
+            cacheable=True,
         )
 
     # ==================== User ====================
@@ -307,7 +663,9 @@ class PuzzleGameAPI:
         params = {}
         if self._timezone:
             params["timezone"] = self._timezone
-        return await self._request("GET", "/user/stats", params=params if params else None)
+        return await self._request(
+            "GET", _URL_USER_STATS, params=params if params else None, cacheable=True
+        )
 
     async def get_my_history(self, limit: int = 50, offset: int = 0) -> dict[str, Any]:
         """
@@ -322,7 +680,10 @@ class PuzzleGameAPI:
                       time_seconds, completed_at}], total, limit, offset}
         """
         return await self._request(
-            "GET", "/user/history", params={"limit": limit, "offset": offset}
+            "GET",
+            _URL_USER_HISTORY,
+            params={"limit": limit, "offset": offset},
+            cacheable=True,
         )
 
     async def get_game_history(
@@ -344,7 +705,9 @@ class PuzzleGameAPI:
         params = {"limit": limit}
         if game_type:
             params["game_type"] = game_type
-        return await self._request("GET", "/user/history", params=params)
+        return await self._request(
+            "GET", _URL_USER_HISTORY, params=params, cacheable=True
+        )
 
     async def update_profile(
         self,
@@ -362,11 +725,13 @@ class PuzzleGameAPI:
             params["display_name"] = display_name
         if email is not None:
             params["email"] = email
-        return await self._request("PATCH", "/user/profile", params=params)
+        return await self._request("PATCH", _URL_USER_PROFILE, params=params)
 
     async def get_user_profile(self, username: str) -> dict[str, Any]:
         """Get a user's public profile."""
-        return await self._request("GET", f"/user/{username}")
+        return await self._request(
+            "GET", _BASE_URL / "user" / username, cacheable=True
+        )
 
     # ==================== Health Check ====================
 
@@ -374,7 +739,7 @@ class PuzzleGameAPI:
         """Check if the API is healthy."""
         try:
             session = await self._get_session()
-            async with session.get(f"{API_BASE_URL}/health") as response:
+            async with session.get(_URL_HEALTH, timeout=_TIMEOUT) as response:
                 return response.status == 200
         except Exception:
             return False
@@ -3,13 +3,15 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Final
 
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     DOMAIN,
@@ -23,8 +25,42 @@ from .api_client import PuzzleGameAPI, PuzzleGameAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
-# Username validation: 3-30 chars, alphanumeric + underscore
-USERNAME_PATTERN = re.compile(r"^[a-zA-Z0-9_]{3,30}$")
+# Username validation: 3-30 chars, ASCII alphanumeric + underscore
+# (byte -> 1 if allowed, indexed by character code)
+USERNAME_CHARS = bytes(
+    1 if chr(i).isascii() and (chr(i).isalnum() or chr(i) == "_") else 0
+    for i in range(256)
+)
+
+# Accepted API key prefixes
+API_KEY_PREFIXES: Final = ("pzl_",)
+
+# Basic email validation: something@domain.tld
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Device info sent on registration (does not change at runtime)
+DEVICE_INFO: Final = {
+    "platform": "home_assistant",
+    "version": "1.0.0",
+}
+
+# Form schemas (built once at import)
+REGISTER_SCHEMA = vol.Schema({
+    vol.Required(CONF_USERNAME): str,
+    vol.Required(CONF_EMAIL): str,
+    vol.Optional(CONF_DISPLAY_NAME, default=""): str,
+})
+API_KEY_SCHEMA = vol.Schema({
+    vol.Required(CONF_API_KEY): str,
+})
+OPTIONS_SCHEMA = vol.Schema({
+    vol.Required(CONF_DISPLAY_NAME): str,
+})
+
+
+def normalize_identifier(value: str | None) -> str:
+    """Normalize a username or email for comparison (trimmed, lowercase)."""
+    return value.strip().lower() if value else ""
 
 
 def validate_username(username: str) -> str | None:
@@ -35,7 +71,11 @@ def validate_username(username: str) -> str | None:
         return "username_too_short"
     if len(username) > 30:
         return "username_too_long"
-    if not USERNAME_PATTERN.match(username):
+    # Fast path for the common case of plain ASCII letters and digits
+    if username.isascii() and username.replace("_", "").isalnum():
+        return None
+    # Non-ASCII characters become "?", which the table rejects
+    if not all(USERNAME_CHARS[b] for b in username.encode("ascii", "replace")):
         return "username_invalid_chars"
     return None
 
@@ -44,8 +84,7 @@ def validate_email(email: str) -> str | None:
     """Validate email format. Returns error key or None if valid."""
     if not email:
         return "email_required"
-    # Basic email validation
-    if "@" not in email or "." not in email.split("@")[-1]:
+    if not EMAIL_PATTERN.match(email):
         return "email_invalid"
     return None
 
@@ -54,7 +93,7 @@ def validate_api_key(api_key: str) -> str | None:
     """Validate API key format. Returns error key or None if valid."""
     if not api_key:
         return "api_key_required"
-    if not api_key.startswith("pzl_"):
+    if not api_key.startswith(API_KEY_PREFIXES):
         return "api_key_invalid"
     return None
 
@@ -71,14 +110,23 @@ class PuzzleGameOnlineConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._username: str | None = None
         self._email: str | None = None
         self._display_name: str | None = None
+        self._unique_checked = False
+        self._reauth_entry: config_entries.ConfigEntry | None = None
+
+    async def _async_ensure_unique(self) -> None:
+        """Abort if the integration is already configured."""
+        if self._unique_checked:
+            return
+        await self.async_set_unique_id(DOMAIN)
+        self._abort_if_unique_id_configured()
+        self._unique_checked = True
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step - choose setup method."""
-        # Check if already configured
-        await self.async_set_unique_id(DOMAIN)
-        self._abort_if_unique_id_configured()
+        # Check if already configured (once per flow)
+        await self._async_ensure_unique()
 
         if user_input is not None:
             if user_input.get("setup_method") == "existing":
@@ -95,89 +143,102 @@ class PuzzleGameOnlineConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle new account registration."""
-        errors: dict[str, str] = {}
+        if user_input is None:
+            return self._async_show_register_form({})
 
-        if user_input is not None:
-            username = user_input.get(CONF_USERNAME, "").strip().lower()
-            email = user_input.get(CONF_EMAIL, "").strip().lower()
-            display_name = user_input.get(CONF_DISPLAY_NAME, "").strip()
-
-            # Validate inputs
-            username_error = validate_username(username)
-            if username_error:
-                errors[CONF_USERNAME] = username_error
-
-            email_error = validate_email(email)
-            if email_error:
-                errors[CONF_EMAIL] = email_error
-
-            # Use username as display name if not provided
-            if not display_name:
-                display_name = username
-
-            if not errors:
-                # Store for potential use in recovery step
-                self._username = username
-                self._email = email
-                self._display_name = display_name
-
-                # Register device with API
-                api = PuzzleGameAPI()
-                try:
-                    # Get device info
-                    device_info = {
-                        "platform": "home_assistant",
-                        "version": "1.0.0",
-                    }
-
-                    # Register device
-                    result = await api.register_device(
-                        username=username,
-                        email=email,
-                        display_name=display_name,
-                        device_info=device_info,
-                    )
-
-                    self._api_key = result.get("api_key")
-                    self._user_id = result.get("user_id")
-                    self._username = result.get("username")
-
-                    await api.close()
-
-                    # Create the config entry
-                    return self.async_create_entry(
-                        title=f"Puzzle Game ({display_name})",
-                        data={
-                            CONF_API_KEY: self._api_key,
-                            CONF_USER_ID: str(self._user_id),
-                            CONF_USERNAME: self._username,
-                            CONF_EMAIL: email,
-                            CONF_DISPLAY_NAME: display_name,
-                        },
-                    )
-                except PuzzleGameAPIError as err:
-                    error_msg = str(err)
-                    _LOGGER.error("Failed to register device: %s", error_msg)
-
-                    # Check for "already registered" error - offer recovery
-                    if "already registered" in error_msg.lower():
-                        await api.close()
-                        return await self.async_step_recover()
-                    else:
-                        errors["base"] = "cannot_connect"
-                except Exception as err:
-                    _LOGGER.exception("Unexpected error during registration: %s", err)
+        errors: dict[str, str] = {}
+        username = normalize_identifier(user_input.get(CONF_USERNAME))
+        email = normalize_identifier(user_input.get(CONF_EMAIL))
+        display_name = user_input.get(CONF_DISPLAY_NAME, "").strip()
+
+        # Validate inputs
+        username_error = validate_username(username)
+        if username_error:
+            errors[CONF_USERNAME] = username_error
+
+        email_error = validate_email(email)
+        if email_error:
+            errors[CONF_EMAIL] = email_error
+
+        # Use username as display name if not provided
+        if not display_name:
+            display_name = username
+
+        if not errors:
+            # Store for potential use in recovery step
+            self._username = username
+            self._email = email
+            self._display_name = display_name
+
+            # Register device with API
+            api = PuzzleGameAPI(session=async_get_clientsession(self.hass))
+            try:
+                # Cheap lookup first, so a taken account skips the registration write
+                availability = await self._async_check_availability(
+                    api, username, email
+                )
+                if availability.get("email_taken"):
+                    return await self.async_step_recover()
+                if availability.get("username_taken"):
+                    errors[CONF_USERNAME] = "username_taken"
+                    return self._async_show_register_form(errors)
+
+                # Register device
+                result = await api.register_device(
+                    username=username,
+                    email=email,
+                    display_name=display_name,
+                    device_info=DEVICE_INFO,
+                )
+
+                self._api_key = result.get("api_key")
+                self._user_id = result.get("user_id")
+                self._username = result.get("username")
+
+                # Create the config entry
+                return self.async_create_entry(
+                    title=f"Puzzle Game ({display_name})",
+                    data={
+                        CONF_API_KEY: self._api_key,
+                        CONF_USER_ID: str(self._user_id),
+                        CONF_USERNAME: self._username,
+                        CONF_EMAIL: email,
+                        CONF_DISPLAY_NAME: display_name,
+                    },
+                )
+            except PuzzleGameAPIError as err:
+                error_msg = str(err)
+                _LOGGER.error("Failed to register device: %s", error_msg)
+
+                # Fallback if the availability check was not conclusive:
+                # "already registered" error - offer recovery
+                if "already registered" in error_msg.lower():
+                    return await self.async_step_recover()
+                else:
                     errors["base"] = "cannot_connect"
-                finally:
-                    await api.close()
+            except Exception as err:
+                _LOGGER.exception("Unexpected error during registration: %s", err)
+                errors["base"] = "cannot_connect"
+
+        return self._async_show_register_form(errors)
+
+    async def _async_check_availability(
+        self, api: PuzzleGameAPI, username: str, email: str
+    ) -> dict[str, Any]:
+        """Look up whether the username or email is already registered."""
+        try:
+            return await api.check_availability(username, email)
+        except PuzzleGameAPIError as err:
+            # Registration itself still reports conflicts
+            _LOGGER.debug("Availability check failed: %s", err)
+            return {}
 
+    @callback
+    def _async_show_register_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the registration form."""
         return self.async_show_form(
             step_id="register",
-            data_schema=vol.Schema({
-                vol.Required(CONF_USERNAME): str,
-                vol.Required(CONF_EMAIL): str,
-                vol.Optional(CONF_DISPLAY_NAME, default=""): str,
-            }),
+            data_schema=REGISTER_SCHEMA,
             errors=errors,
             description_placeholders={
                 "api_url": "puzzleapi.techshit.xyz",
@@ -188,51 +249,52 @@ class PuzzleGameOnlineConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle setup with existing API key."""
-        errors: dict[str, str] = {}
+        if user_input is None:
+            return self._async_show_existing_form({})
 
-        if user_input is not None:
-            api_key = user_input.get(CONF_API_KEY, "").strip()
-
-            # Validate API key format
-            api_key_error = validate_api_key(api_key)
-            if api_key_error:
-                errors[CONF_API_KEY] = api_key_error
-            else:
-                # Try to validate the API key and get user info
-                api = PuzzleGameAPI(api_key)
-                try:
-                    stats = await api.get_my_stats()
-                    await api.close()
-
-                    # Extract user info from stats response
-                    username = stats.get("username", "")
-                    display_name = stats.get("display_name", username)
-
-                    # API key is valid, create the entry
-                    return self.async_create_entry(
-                        title=f"Puzzle Game ({display_name})",
-                        data={
-                            CONF_API_KEY: api_key,
-                            CONF_USER_ID: "",
-                            CONF_USERNAME: username,
-                            CONF_EMAIL: "",
-                            CONF_DISPLAY_NAME: display_name,
-                        },
-                    )
-                except PuzzleGameAPIError as err:
-                    _LOGGER.error("Invalid API key: %s", err)
-                    errors[CONF_API_KEY] = "api_key_invalid"
-                except Exception as err:
-                    _LOGGER.exception("Error validating API key: %s", err)
-                    errors["base"] = "cannot_connect"
-                finally:
-                    await api.close()
+        errors: dict[str, str] = {}
+        api_key = user_input.get(CONF_API_KEY, "").strip()
+
+        # Validate API key format
+        api_key_error = validate_api_key(api_key)
+        if api_key_error:
+            errors[CONF_API_KEY] = api_key_error
+        else:
+            # Try to validate the API key and get user info
+            api = PuzzleGameAPI(api_key, session=async_get_clientsession(self.hass))
+            try:
+                stats = await api.get_my_stats()
+
+                # Extract user info from stats response
+                username = stats.get("username", "")
+                display_name = stats.get("display_name", username)
+
+                # API key is valid, create the entry
+                return self.async_create_entry(
+                    title=f"Puzzle Game ({display_name})",
+                    data={
+                        CONF_API_KEY: api_key,
+                        CONF_USER_ID: "",
+                        CONF_USERNAME: username,
+                        CONF_EMAIL: "",
+                        CONF_DISPLAY_NAME: display_name,
+                    },
+                )
+            except PuzzleGameAPIError as err:
+                _LOGGER.error("Invalid API key: %s", err)
+                errors[CONF_API_KEY] = "api_key_invalid"
+            except Exception as err:
+                _LOGGER.exception("Error validating API key: %s", err)
+                errors["base"] = "cannot_connect"
+
+        return self._async_show_existing_form(errors)
 
+    @callback
+    def _async_show_existing_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the existing API key form."""
         return self.async_show_form(
             step_id="existing",
-            data_schema=vol.Schema({
-                vol.Required(CONF_API_KEY): str,
-            }),
+            data_schema=API_KEY_SCHEMA,
             errors=errors,
         )
 
@@ -240,53 +302,110 @@ class PuzzleGameOnlineConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle recovery step - enter existing API key."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            api_key = user_input.get(CONF_API_KEY, "").strip()
+        if user_input is None:
+            return self._async_show_recover_form({})
 
-            # Validate API key format
-            api_key_error = validate_api_key(api_key)
-            if api_key_error:
-                errors[CONF_API_KEY] = api_key_error
-            else:
-                # Try to validate the API key
-                api = PuzzleGameAPI(api_key)
-                try:
-                    stats = await api.get_my_stats()
-                    await api.close()
-
-                    # API key is valid, create the entry
-                    return self.async_create_entry(
-                        title=f"Puzzle Game ({self._display_name or self._username})",
-                        data={
-                            CONF_API_KEY: api_key,
-                            CONF_USER_ID: "",  # We don't have this from recovery
-                            CONF_USERNAME: self._username or "",
-                            CONF_EMAIL: self._email or "",
-                            CONF_DISPLAY_NAME: self._display_name or self._username or "",
-                        },
-                    )
-                except PuzzleGameAPIError as err:
-                    _LOGGER.error("Invalid API key: %s", err)
-                    errors[CONF_API_KEY] = "api_key_invalid"
-                except Exception as err:
-                    _LOGGER.exception("Error validating API key: %s", err)
-                    errors["base"] = "cannot_connect"
-                finally:
-                    await api.close()
+        errors: dict[str, str] = {}
+        api_key = user_input.get(CONF_API_KEY, "").strip()
+
+        # Validate API key format
+        api_key_error = validate_api_key(api_key)
+        if api_key_error:
+            errors[CONF_API_KEY] = api_key_error
+        else:
+            # Try to validate the API key
+            api = PuzzleGameAPI(api_key, session=async_get_clientsession(self.hass))
+            try:
+                await api.get_my_stats()
+
+                # API key is valid, create the entry
+                return self.async_create_entry(
+                    title=f"Puzzle Game ({self._display_name or self._username})",
+                    data={
+                        CONF_API_KEY: api_key,
+                        CONF_USER_ID: "",  # We don't have this from recovery
+                        CONF_USERNAME: self._username or "",
+                        CONF_EMAIL: self._email or "",
+                        CONF_DISPLAY_NAME: self._display_name or self._username or "",
+                    },
+                )
+            except PuzzleGameAPIError as err:
+                _LOGGER.error("Invalid API key: %s", err)
+                errors[CONF_API_KEY] = "api_key_invalid"
+            except Exception as err:
+                _LOGGER.exception("Error validating API key: %s", err)
+                errors["base"] = "cannot_connect"
+
+        return self._async_show_recover_form(errors)
 
+    @callback
+    def _async_show_recover_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the account recovery form."""
         return self.async_show_form(
             step_id="recover",
-            data_schema=vol.Schema({
-                vol.Required(CONF_API_KEY): str,
-            }),
+            data_schema=API_KEY_SCHEMA,
             errors=errors,
             description_placeholders={
                 "username": self._username or "your account",
             },
         )
 
+    async def async_step_reauth(
+        self, entry_data: Mapping[str, Any]
+    ) -> FlowResult:
+        """Handle an API key rejected by the server."""
+        self._reauth_entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
+        )
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for a new API key and update the entry."""
+        if user_input is None:
+            return self._async_show_reauth_form({})
+
+        errors: dict[str, str] = {}
+        api_key = user_input.get(CONF_API_KEY, "").strip()
+
+        # Validate API key format
+        api_key_error = validate_api_key(api_key)
+        if api_key_error:
+            errors[CONF_API_KEY] = api_key_error
+        else:
+            api = PuzzleGameAPI(api_key, session=async_get_clientsession(self.hass))
+            try:
+                await api.get_my_stats()
+
+                # API key is valid, store it and reload the entry
+                entry = self._reauth_entry
+                self.hass.config_entries.async_update_entry(
+                    entry, data={**entry.data, CONF_API_KEY: api_key}
+                )
+                await self.hass.config_entries.async_reload(entry.entry_id)
+                return self.async_abort(reason="reauth_successful")
+            except PuzzleGameAPIError as err:
+                _LOGGER.error("Invalid API key: %s", err)
+                errors[CONF_API_KEY] = "api_key_invalid"
+            except Exception as err:
+                _LOGGER.exception("Error validating API key: %s", err)
+                errors["base"] = "cannot_connect"
+
+        return self._async_show_reauth_form(errors)
+
+    @callback
+    def _async_show_reauth_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the reauthentication form."""
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=API_KEY_SCHEMA,
+            errors=errors,
+            description_placeholders={
+                "username": self._reauth_entry.data.get(CONF_USERNAME, ""),
+            },
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -303,49 +422,51 @@ class PuzzleGameOnlineOptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle options flow."""
-        errors: dict[str, str] = {}
+        if user_input is None:
+            return self._async_show_init_form({})
 
-        if user_input is not None:
-            new_display_name = user_input.get(CONF_DISPLAY_NAME, "").strip()
-
-            if not new_display_name:
-                errors[CONF_DISPLAY_NAME] = "display_name_required"
-            else:
-                # Update display name via API
-                api = PuzzleGameAPI(self.config_entry.data.get(CONF_API_KEY))
-                try:
-                    await api.update_profile(display_name=new_display_name)
-                    await api.close()
-
-                    # Update config entry
-                    new_data = dict(self.config_entry.data)
-                    new_data[CONF_DISPLAY_NAME] = new_display_name
-
-                    self.hass.config_entries.async_update_entry(
-                        self.config_entry,
-                        data=new_data,
-                        title=f"Puzzle Game ({new_display_name})",
-                    )
-
-                    return self.async_create_entry(title="", data={})
-                except PuzzleGameAPIError as err:
-                    _LOGGER.error("Failed to update display name: %s", err)
-                    errors["base"] = "cannot_connect"
-                finally:
-                    await api.close()
+        errors: dict[str, str] = {}
+        entry_data = self.config_entry.data
+        new_display_name = user_input.get(CONF_DISPLAY_NAME, "").strip()
+
+        if not new_display_name:
+            errors[CONF_DISPLAY_NAME] = "display_name_required"
+        else:
+            # Update display name via API
+            api = PuzzleGameAPI(
+                entry_data.get(CONF_API_KEY),
+                session=async_get_clientsession(self.hass),
+            )
+            try:
+                await api.update_profile(display_name=new_display_name)
+
+                # Update config entry
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    data={**entry_data, CONF_DISPLAY_NAME: new_display_name},
+                    title=f"Puzzle Game ({new_display_name})",
+                )
+
+                return self.async_create_entry(title="", data={})
+            except PuzzleGameAPIError as err:
+                _LOGGER.error("Failed to update display name: %s", err)
+                errors["base"] = "cannot_connect"
+
+        return self._async_show_init_form(errors)
 
-        current_display_name = self.config_entry.data.get(CONF_DISPLAY_NAME, "")
-        current_api_key = self.config_entry.data.get(CONF_API_KEY, "")
+    @callback
+    def _async_show_init_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the options form."""
+        entry_data = self.config_entry.data
+        current_display_name = entry_data.get(CONF_DISPLAY_NAME, "")
+        current_api_key = entry_data.get(CONF_API_KEY, "")
 
         # Show current API key (masked) and display name
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_DISPLAY_NAME,
-                    default=current_display_name
-                ): str,
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, {CONF_DISPLAY_NAME: current_display_name}
+            ),
             errors=errors,
             description_placeholders={
                 "api_key": current_api_key,
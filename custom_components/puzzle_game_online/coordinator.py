@@ -1,19 +1,53 @@
 """Coordinator for Puzzle Game Online integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Callable
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback, Event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.event import async_track_state_change_event
 
-from .api_client import PuzzleGameAPI
+from .api_client import PuzzleGameAPI, PuzzleGameAPIError, PuzzleGameAuthError
 from .game_manager import GameManager
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_SPEECH_EVENT = f"{DOMAIN}_speech"
+
+# Keys of the game state dict, in the order built by _build_game_state
+_STATE_KEYS = (
+    "session_id",
+    "puzzle_id",
+    "phase",
+    "word_number",
+    "score",
+    "reveals",
+    "blanks",
+    "clue",
+    "solved_words",
+    "solved_word_indices",
+    "skipped_word_indices",
+    "is_active",
+    "last_message",
+    "theme_revealed",
+    "wager_amount",
+    "theme_display",
+    "theme_length",
+    "theme_word_count",
+    "session_active",
+    "active_satellite",
+    "view_assist_device",
+    "spelling_mode",
+    "spelling_buffer",
+    "current_score",
+    "pending_theme_guess",
+    "awaiting_theme_confirmation",
+)
+
 
 class PuzzleGameCoordinator(DataUpdateCoordinator):
     """Coordinator for managing puzzle game state."""
@@ -32,77 +66,78 @@ class PuzzleGameCoordinator(DataUpdateCoordinator):
         )
         self.api = api
         self.game_manager = GameManager(api)
-        self._update_listeners: list[Callable[[], None]] = []
+        self._update_listeners: set[Callable[[], None]] = set()
         self._stt_unsub: Callable[[], None] | None = None
-
-    @property
-    def is_game_active(self) -> bool:
-        """Return if a game is currently active."""
-        return self.game_manager.state.is_active
-
-    @property
-    def game_state(self) -> dict[str, Any]:
-        """Return the current game state."""
+        self._current_stt_sensor: str | None = None
+        self._stt_sensor_cache: dict[str, str] = {}
+        # Serializes game state transitions, so a quick action cannot change
+        # the game while another one is waiting on the API
+        self._state_lock = asyncio.Lock()
+        # The published game state, entities read it from here
+        self.data: dict[str, Any] = self._build_game_state()
+        # Bumped whenever data changes, so entities can compare an int
+        self.state_version: int = 0
+
+    def _build_game_state(self) -> dict[str, Any]:
+        """Build the game state dict from the game manager."""
         state = self.game_manager.state
         reveals_remaining = state.reveals_available - state.reveals_used
 
-        # Get solved word displays
-        solved_words_display = []
-        for i in state.solved_words:
-            if i in state.word_displays:
-                solved_words_display.append(state.word_displays[i])
-
-        return {
-            "session_id": state.session_id,
-            "puzzle_id": state.puzzle_id,
-            "phase": state.phase,
-            "word_number": state.current_word_index + 1 if state.phase == 1 else 6,
-            "score": state.final_score or 0,
-            "reveals": reveals_remaining,
-            "blanks": self.game_manager.get_current_blanks(),
-            "clue": self.game_manager.get_current_clue(),
-            "solved_words": solved_words_display,
-            "solved_word_indices": list(state.solved_words),  # Make a copy to avoid reference issues
-            "skipped_word_indices": list(state.skipped_words),  # For showing X on skipped words
-            "is_active": state.is_active,
-            "last_message": state.last_message,
-            "theme_revealed": state.theme if not state.is_active else None,
-            "wager_amount": state.wager_amount,
-            "theme_display": state.theme_display,
-            "theme_length": state.theme_length,
-            "theme_word_count": state.theme_word_count,
-            "session_active": self.game_manager.session_active,
-            "active_satellite": self.game_manager.active_satellite,
-            "view_assist_device": self.game_manager.view_assist_device,
-            "spelling_mode": self.game_manager.spelling_mode,
-            "spelling_buffer": self.game_manager.spelling_buffer,
-            "current_score": state.current_score,
-            "pending_theme_guess": state.pending_theme_guess,
-            "awaiting_theme_confirmation": state.awaiting_theme_confirmation,
-        }
+        return dict(zip(_STATE_KEYS, (
+            state.session_id,
+            state.puzzle_id,
+            state.phase,
+            state.current_word_index + 1 if state.phase == 1 else 6,
+            state.final_score or 0,
+            reveals_remaining,
+            self.game_manager.get_current_blanks(),
+            self.game_manager.get_current_clue(),
+            list(state.solved_words_display),
+            list(state.solved_words),  # Same order as solved_words_display
+            list(state.skipped_words),  # For showing X on skipped words
+            state.is_active,
+            state.last_message,
+            state.theme if not state.is_active else None,
+            state.wager_amount,
+            state.theme_display,
+            state.theme_length,
+            state.theme_word_count,
+            self.game_manager.session_active,
+            self.game_manager.active_satellite,
+            self.game_manager.view_assist_device,
+            self.game_manager.spelling_mode,
+            list(self.game_manager.spelling_buffer),  # Published as a list of letters
+            state.current_score,
+            state.pending_theme_guess,
+            state.awaiting_theme_confirmation,
+        )))
 
     async def async_start_game(self, is_bonus: bool = False) -> dict[str, Any]:
         """Start a new game."""
-        result = await self.game_manager.start_game(is_bonus)
-        await self._notify_update()
+        async with self._state_lock:
+            result = await self.game_manager.start_game(is_bonus)
+            self._notify_update()
         return result
 
     async def async_submit_answer(self, answer: str) -> dict[str, Any]:
         """Submit an answer."""
-        result = await self.game_manager.submit_answer(answer)
-        await self._notify_update()
+        async with self._state_lock:
+            result = await self.game_manager.submit_answer(answer)
+            self._notify_update()
         return result
 
     async def async_reveal_letter(self) -> dict[str, Any]:
         """Reveal a letter."""
-        result = await self.game_manager.reveal_letter()
-        await self._notify_update()
+        async with self._state_lock:
+            result = await self.game_manager.reveal_letter()
+            self._notify_update()
         return result
 
-    def skip_word(self) -> dict[str, Any]:
+    async def async_skip_word(self) -> dict[str, Any]:
         """Skip the current word."""
-        result = self.game_manager.skip_word()
-        self.hass.async_create_task(self._notify_update())
+        async with self._state_lock:
+            result = self.game_manager.skip_word()
+            self._notify_update()
         return result
 
     def repeat_clue(self) -> dict[str, Any]:
@@ -116,40 +151,62 @@ class PuzzleGameCoordinator(DataUpdateCoordinator):
             "blanks": blanks,
         }
 
-    def start_spelling(self) -> dict[str, Any]:
+    async def async_start_spelling(self) -> dict[str, Any]:
         """Enter spelling mode."""
-        result = self.game_manager.start_spelling()
-        self.hass.async_create_task(self._notify_update())
+        async with self._state_lock:
+            result = self.game_manager.start_spelling()
+            self._notify_update()
         return result
 
-    def add_letter(self, letter: str) -> dict[str, Any]:
+    async def async_add_letter(self, letter: str) -> dict[str, Any]:
         """Add a letter in spelling mode."""
-        result = self.game_manager.add_letter(letter)
-        self.hass.async_create_task(self._notify_update())
+        async with self._state_lock:
+            result = self.game_manager.add_letter(letter)
+            self._notify_update()
         return result
 
+    async def async_add_letters(self, letters: list[str]) -> dict[str, Any]:
+        """Add several letters in spelling mode with a single update.
+
+        Stops at the first rejected letter; "letters" lists the ones added.
+        """
+        result: dict[str, Any] = {"success": False, "message": "Invalid letter"}
+        accepted: list[str] = []
+        async with self._state_lock:
+            for letter in letters:
+                result = self.game_manager.add_letter(letter)
+                if not result["success"]:
+                    break
+                accepted.append(letter)
+            self._notify_update()
+        return {**result, "letters": accepted}
+
     async def async_finish_spelling(self, text: str | None = None) -> dict[str, Any]:
         """Finish spelling and submit."""
-        result = await self.game_manager.finish_spelling(text)
-        await self._notify_update()
+        async with self._state_lock:
+            result = await self.game_manager.finish_spelling(text)
+            self._notify_update()
         return result
 
-    def cancel_spelling(self) -> dict[str, Any]:
+    async def async_cancel_spelling(self) -> dict[str, Any]:
         """Cancel spelling mode."""
-        result = self.game_manager.cancel_spelling()
-        self.hass.async_create_task(self._notify_update())
+        async with self._state_lock:
+            result = self.game_manager.cancel_spelling()
+            self._notify_update()
         return result
 
     async def async_give_up(self) -> dict[str, Any]:
         """Give up the current game."""
-        result = await self.game_manager.give_up()
-        await self._notify_update()
+        async with self._state_lock:
+            result = await self.game_manager.give_up()
+            self._notify_update()
         return result
 
-    def set_wager(self, points: int) -> dict[str, Any]:
+    async def async_set_wager(self, points: int) -> dict[str, Any]:
         """Set the wager amount in points."""
-        result = self.game_manager.set_wager(points)
-        self.hass.async_create_task(self._notify_update())
+        async with self._state_lock:
+            result = self.game_manager.set_wager(points)
+            self._notify_update()
         return result
 
     def set_session(
@@ -159,49 +216,70 @@ class PuzzleGameCoordinator(DataUpdateCoordinator):
         view_assist_device: str | None = None,
     ) -> None:
         """Set session state."""
-        self.game_manager.set_session(active, satellite, view_assist_device)
+        manager = self.game_manager
+        if (
+            manager.session_active == active
+            and manager.active_satellite == satellite
+            and manager.view_assist_device == view_assist_device
+        ):
+            # Nothing changed, keep the STT subscription and skip the update
+            manager.reset_timeout()
+            return
+
+        manager.set_session(active, satellite, view_assist_device)
 
         if active and satellite:
             # Derive STT sensor from satellite name and start watching
-            device_name = satellite.split('.')[1] if '.' in satellite else satellite
-            stt_sensor = f"sensor.{device_name}_stt"
+            stt_sensor = self._stt_sensor_cache.get(satellite)
+            if stt_sensor is None:
+                _, sep, device_name = satellite.partition(".")
+                if not sep:
+                    device_name = satellite
+                stt_sensor = f"sensor.{device_name}_stt"
+                self._stt_sensor_cache[satellite] = stt_sensor
             self._start_stt_watch(stt_sensor)
         elif not active:
             # Stop watching STT when session ends
             self._stop_stt_watch()
 
-        self.hass.async_create_task(self._notify_update())
+        self._notify_update()
 
     def _start_stt_watch(self, stt_sensor: str) -> None:
         """Start watching the STT sensor for changes."""
+        # Already subscribed to this sensor
+        if self._stt_unsub and stt_sensor == self._current_stt_sensor:
+            return
+
         # Stop any existing watch first
         self._stop_stt_watch()
 
+        # Must stay a plain @callback so the state tracker runs it inline
+        # rather than scheduling a task per STT update
         @callback
         def _stt_state_changed(event: Event) -> None:
             """Handle STT sensor state change."""
+            # Only fire event if there's actual speech content and it changed
             new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
-
-            if new_state is None:
+            if new_state is None or not new_state.state:
                 return
-
             new_value = new_state.state
+            old_state = event.data.get("old_state")
             old_value = old_state.state if old_state else ""
+            if new_value == old_value:
+                return
 
-            # Only fire event if there's actual speech content and it changed
-            if new_value and len(new_value) > 0 and new_value != old_value:
-                # Fire custom event for the blueprint to catch
-                self.hass.bus.async_fire(f"{DOMAIN}_speech", {
-                    "entity_id": stt_sensor,
-                    "text": new_value,
-                    "old_text": old_value,
-                })
-                _LOGGER.info("Fired %s_speech event: %s", DOMAIN, new_value)
+            # Fire custom event for the blueprint to catch
+            self.hass.bus.async_fire(_SPEECH_EVENT, {
+                "entity_id": stt_sensor,
+                "text": new_value,
+                "old_text": old_value,
+            }, context=event.context)
+            _LOGGER.debug("Fired %s event: %s", _SPEECH_EVENT, new_value)
 
         self._stt_unsub = async_track_state_change_event(
             self.hass, [stt_sensor], _stt_state_changed
         )
+        self._current_stt_sensor = stt_sensor
         _LOGGER.info("Started watching STT sensor: %s", stt_sensor)
 
     def _stop_stt_watch(self) -> None:
@@ -209,18 +287,36 @@ class PuzzleGameCoordinator(DataUpdateCoordinator):
         if self._stt_unsub:
             self._stt_unsub()
             self._stt_unsub = None
+            self._current_stt_sensor = None
             _LOGGER.info("Stopped watching STT sensor")
 
-    def handle_timeout(self) -> dict[str, Any]:
+    async def async_handle_timeout(self) -> dict[str, Any]:
         """Handle listening timeout."""
-        result = self.game_manager.handle_timeout()
-        self.hass.async_create_task(self._notify_update())
+        async with self._state_lock:
+            result = self.game_manager.handle_timeout()
+            self._notify_update()
         return result
 
     def reset_timeout(self) -> None:
         """Reset timeout counter."""
         self.game_manager.reset_timeout()
 
+    async def async_validate_auth(self, entry: ConfigEntry) -> bool:
+        """Check that the configured API key is accepted by the server.
+
+        A rejected key starts the reauth flow for the entry.
+        """
+        try:
+            await self.api.get_my_stats()
+        except PuzzleGameAuthError as err:
+            _LOGGER.error("API key rejected by Puzzle Game Online: %s", err)
+            entry.async_start_reauth(self.hass)
+            return False
+        except PuzzleGameAPIError as err:
+            _LOGGER.warning("Could not validate API key: %s", err)
+            return False
+        return True
+
     # ==================== Stats & Leaderboard ====================
 
     async def async_get_leaderboard(
@@ -235,29 +331,49 @@ class PuzzleGameCoordinator(DataUpdateCoordinator):
 
     async def async_get_my_games(self, limit: int = 10) -> dict[str, Any]:
         """Get user's recent games."""
-        return await self.api.get_my_games(limit=limit)
+        return await self.api.get_game_history(limit=limit)
 
     async def async_get_user_info(self) -> dict[str, Any]:
         """Get current user info."""
-        return await self.api.get_current_user()
+        return await self.api.get_my_stats()
 
     # ==================== Update Notifications ====================
 
     @callback
     def add_update_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
         """Add a listener for state updates."""
-        self._update_listeners.append(listener)
+        self._update_listeners.add(listener)
 
         @callback
         def remove_listener() -> None:
-            self._update_listeners.remove(listener)
+            self._update_listeners.discard(listener)
 
         return remove_listener
 
-    async def _notify_update(self) -> None:
-        """Notify all listeners of state update."""
-        self.async_set_updated_data(self.game_state)
+    @callback
+    def _notify_update(self) -> None:
+        """Publish the current game state to listeners.
+
+        Runs before each action returns, so the next automation step reads
+        the new state; batches such as add_letters call it once at the end.
+        """
+        state = self._build_game_state()
+        # Don't wake every listener for a mutation that changed nothing
+        if state == self.data:
+            return
+        self.state_version += 1
+        self.async_set_updated_data(state)
+
+    async def async_request_refresh(self) -> None:
+        """Publish the current game state.
+
+        All state lives locally, so there is nothing to fetch or debounce.
+        """
+        state = self._build_game_state()
+        if state != self.data:
+            self.state_version += 1
+        self.async_set_updated_data(state)
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API."""
-        return self.game_state
+        """Return the published game state."""
+        return self.data
@@ -1,16 +1,118 @@
 """Game manager for Puzzle Game Online."""
 from __future__ import annotations
 
+import bisect
 import logging
 import random
+import re
+import time
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Final
 
 from .api_client import PuzzleGameAPI, PuzzleGameAPIError
 from .const import WORDS_PER_PUZZLE, BASE_REVEALS
 
 _LOGGER = logging.getLogger(__name__)
 
+# GameState attributes copied as-is by GameState.to_dict
+_STATE_ATTRS = (
+    "puzzle_id",
+    "session_id",
+    "is_bonus",
+    "phase",
+    "current_word_index",
+    "reveals_available",
+    "reveals_used",
+    "theme_solved",
+    "is_active",
+    "gave_up",
+    "final_score",
+    "last_message",
+    "wager_amount",
+    "current_score",
+    "pending_theme_guess",
+    "awaiting_theme_confirmation",
+    "theme_display",
+    "theme_length",
+    "theme_word_count",
+)
+_STATE_GETTER = attrgetter(*_STATE_ATTRS)
+
+
+# Points for a solved word by reveals used: 0, 1, 2, 3+
+_SCORE_TIERS = (20, 15, 10, 5)
+
+# Word phase messages
+_MSG_START = "Let's play the {game_type}! Word 1 of 5. {clue}"
+_MSG_CORRECT = "Correct! {solved} of 5 words solved. Word {number}. {clue}"
+_MSG_SKIPPED = "Skipped. Word {number} of 5. {clue}"
+_MSG_BACK_TO_WORD = "Back to word {number}. {clue}"
+_MSG_WRONG_LENGTH = "Not quite. That's {count} letters, I need {expected}. Try again!"
+
+# Timeout prompts, indexed by timeout count - 1
+_TIMEOUT_PREFIXES = ("Still thinking? ", "Take your time. ")
+_MSG_TIMEOUT_PAUSE = "I'll pause the game. Say 'continue puzzle game' when ready."
+
+# Wager phase messages
+_MSG_WAGER_PROMPT = (
+    "All 5 words solved! Your score so far is {score} points. "
+    "Time to make your wager! You can bet anywhere from 0 to {score} points on guessing the theme. "
+    "If you guess correctly, you win your wager. If you're wrong, you lose it. "
+    "Say 'wager' followed by a number, 'no wager' to play it safe, or 'all in' to risk all {score} points!"
+)
+_MSG_NO_WAGER = "No wager. You'll keep your current score no matter what."
+_MSG_ALL_IN = "All in with {points} points! Get it right to double up, wrong and you lose it all!"
+_MSG_WAGERING = "Wagering {points} points. Get it right to win {points} more, wrong and you lose {points}."
+_MSG_THEME_WORDS = " The theme is {words} words, {length} letters total."
+_MSG_THEME_LETTERS = " The theme is {length} letters."
+
+# NATO phonetic alphabet mapping
+_NATO_ALPHABET: Final = MappingProxyType({
+    "ALPHA": "A", "ALFA": "A", "BRAVO": "B", "CHARLIE": "C",
+    "DELTA": "D", "ECHO": "E", "FOXTROT": "F", "GOLF": "G",
+    "HOTEL": "H", "INDIA": "I", "JULIET": "J", "JULIETT": "J",
+    "KILO": "K", "LIMA": "L", "MIKE": "M", "NOVEMBER": "N",
+    "OSCAR": "O", "PAPA": "P", "QUEBEC": "Q", "ROMEO": "R",
+    "SIERRA": "S", "TANGO": "T", "UNIFORM": "U", "VICTOR": "V",
+    "WHISKEY": "W", "WHISKY": "W", "XRAY": "X", "X-RAY": "X",
+    "YANKEE": "Y", "ZULU": "Z",
+})
+# A NATO phonetic word or a single letter, with surrounding punctuation
+_NATO_WORD = (
+    r"[.,!?]*(ALPHA|ALFA|BRAVO|CHARLIE|DELTA|ECHO|FOXTROT|GOLF|HOTEL|INDIA"
+    r"|JULIETT?|KILO|LIMA|MIKE|NOVEMBER|OSCAR|PAPA|QUEBEC|ROMEO|SIERRA|TANGO"
+    r"|UNIFORM|VICTOR|WHISKE?Y|X-?RAY|YANKEE|ZULU|[^\W\d_])[.,!?]*"
+)
+_NATO_WORD_RE = re.compile(rf"(?<!\S){_NATO_WORD}(?!\S)")
+_NATO_SPELLING_RE = re.compile(rf"{_NATO_WORD}(?:\s+{_NATO_WORD})+")
+# Single letters separated by spaces, dashes or dots
+_SPELLED_RE = re.compile(r"[\s.-]*[^\W\d_](?:[\s.-]+[^\W\d_])+[\s.-]*")
+_STRIP_DOTS_DASHES = str.maketrans("", "", ".-")
+
+# Deletes every ASCII character that is not a letter
+_STRIP_NON_LETTERS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isalpha())
+)
+
+
+def _lowest_bit(mask: int) -> int:
+    """Return the index of the lowest set bit in a non-zero mask."""
+    return (mask & -mask).bit_length() - 1
+
+
+def _word_points(reveals_used: int) -> int:
+    """Return the points for a solved word given the reveals used on it."""
+    return _SCORE_TIERS[min(reveals_used, 3)]
+
+
+@lru_cache(maxsize=32)
+def _blank_display(length: int) -> str:
+    """Return the all-blanks display for a word of the given length."""
+    return " ".join("_" * length)
+
 
 class GameState:
     """Represents the current game state."""
@@ -31,6 +133,7 @@ class GameState:
         # Game progress
         self.phase: int = 1  # 1 = solving words, 2 = guessing theme
         self.current_word_index: int = 0
+        self.current_clue: str = "No clue"  # Clue for current_word_index
         self.reveals_available: int = BASE_REVEALS
         self.reveals_used: int = 0
 
@@ -39,17 +142,27 @@ class GameState:
         self.current_score: int = 0  # Estimated score before wager (for max wager calculation)
 
         # Tracking (mirrored from server)
-        self.solved_words: list[int] = []  # Indices of solved words
-        self.skipped_words: list[int] = []  # Indices of skipped words
-        self.revealed_letters: dict[int, list[int]] = {}  # word_index -> letter positions
+        self.solved_words: dict[int, None] = {}  # Indices of solved words, in solve order
+        self.skipped_words: dict[int, None] = {}  # Indices of skipped words, in skip order
+        self.solved_sorted: list[int] = []  # solved_words in index order
+        # Bit i set when word i is solved / skipped, for next word lookup
+        self.solved_mask: int = 0
+        self.skipped_mask: int = 0
+        self.revealed_letters: dict[int, int] = {}  # word_index -> bitmask of letter positions
         self.word_displays: dict[int, str] = {}  # word_index -> display string (e.g., "A _ _ L E")
+        self.word_letters: dict[int, list[str]] = {}  # word_index -> one entry per letter, "_" if hidden
+        self.solved_words_display: list[str] = []  # Displays of solved words, in solve order
+        self.solved_words_score: int = 0  # Points earned by solved words so far
         self.theme_solved: bool = False
 
         # Status
         self.is_active: bool = False
         self.gave_up: bool = False
-        self.started_at: datetime | None = None
-        self.completed_at: datetime | None = None
+        self.started_epoch: float | None = None
+        self.completed_epoch: float | None = None
+        self.started_monotonic: float | None = None  # For measuring play time
+        self._started_iso: str | None = None
+        self._completed_iso: str | None = None
 
         # Score (tracked server-side but we keep local copy)
         self.words_solved_count: int = 0
@@ -62,35 +175,36 @@ class GameState:
         # Last feedback
         self.last_message: str = ""
 
+    @property
+    def started_at(self) -> datetime | None:
+        """Return when the game was started."""
+        if self.started_epoch is None:
+            return None
+        return datetime.fromtimestamp(self.started_epoch)
+
+    @property
+    def completed_at(self) -> datetime | None:
+        """Return when the game was completed."""
+        if self.completed_epoch is None:
+            return None
+        return datetime.fromtimestamp(self.completed_epoch)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert state to dictionary for sensor attributes."""
-        return {
-            "puzzle_id": self.puzzle_id,
-            "session_id": self.session_id,
-            "is_bonus": self.is_bonus,
-            "phase": self.phase,
-            "current_word_index": self.current_word_index,
-            "words_count": len(self.words_data),
-            "reveals_available": self.reveals_available,
-            "reveals_used": self.reveals_used,
-            "solved_words": self.solved_words,
-            "solved_count": len(self.solved_words),
-            "skipped_words": self.skipped_words,
-            "theme_solved": self.theme_solved,
-            "is_active": self.is_active,
-            "gave_up": self.gave_up,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "final_score": self.final_score,
-            "last_message": self.last_message,
-            "wager_amount": self.wager_amount,
-            "current_score": self.current_score,
-            "pending_theme_guess": self.pending_theme_guess,
-            "awaiting_theme_confirmation": self.awaiting_theme_confirmation,
-            "theme_display": self.theme_display,
-            "theme_length": self.theme_length,
-            "theme_word_count": self.theme_word_count,
-        }
+        # Timestamps are set once per game, so format them only once
+        if self._started_iso is None and self.started_epoch is not None:
+            self._started_iso = self.started_at.isoformat()
+        if self._completed_iso is None and self.completed_epoch is not None:
+            self._completed_iso = self.completed_at.isoformat()
+
+        data = dict(zip(_STATE_ATTRS, _STATE_GETTER(self)))
+        data["words_count"] = len(self.words_data)
+        data["solved_words"] = list(self.solved_words)
+        data["solved_count"] = len(self.solved_words)
+        data["skipped_words"] = list(self.skipped_words)
+        data["started_at"] = self._started_iso
+        data["completed_at"] = self._completed_iso
+        return data
 
     def reset(self) -> None:
         """Reset the game state."""
@@ -112,7 +226,7 @@ class GameManager:
 
         # Spelling mode
         self.spelling_mode: bool = False
-        self.spelling_buffer: list[str] = []
+        self.spelling_buffer: str = ""
 
         # Timeout tracking
         self.timeout_count: int = 0
@@ -154,31 +268,43 @@ class GameManager:
             self.state.theme_word_count = puzzle_data.get("theme_word_count", 1)
 
             # Initialize word displays with blanks
-            for i, word_data in enumerate(self.state.words_data):
-                length = word_data.get("length", 5)
-                self.state.word_displays[i] = " ".join(["_"] * length)
+            lengths = [word_data.get("length", 5) for word_data in self.state.words_data]
+            self.state.word_displays = {i: _blank_display(n) for i, n in enumerate(lengths)}
+            self.state.word_letters = {i: ["_"] * n for i, n in enumerate(lengths)}
 
             # Set reveals from session
             self.state.reveals_available = session_data.get("reveals_available", BASE_REVEALS)
-            self.state.solved_words = session_data.get("solved_words", [])
+            solved_words = session_data.get("solved_words", [])
+            self.state.solved_words = dict.fromkeys(solved_words)
+            self.state.solved_sorted = sorted(self.state.solved_words)
+            for i in self.state.solved_words:
+                self.state.solved_mask |= 1 << i
+            self.state.solved_words_score = _word_points(0) * len(self.state.solved_words)
             self.state.theme_solved = session_data.get("theme_solved", False)
 
             # Restore solved word displays from session (for continuing paused games)
             solved_word_answers = session_data.get("solved_word_answers", {})
-            for word_idx_str, answer in solved_word_answers.items():
-                word_idx = int(word_idx_str)
-                self.state.word_displays[word_idx] = answer
+            self.state.word_displays.update(
+                {int(word_idx): answer for word_idx, answer in solved_word_answers.items()}
+            )
+
+            self.state.solved_words_display = [
+                self.state.word_displays[i]
+                for i in solved_words
+                if i in self.state.word_displays
+            ]
 
             # Mark as active
             self.state.is_active = True
-            self.state.started_at = datetime.now()
+            self.state.started_epoch = time.time()
+            self.state.started_monotonic = time.monotonic()
             self.state.phase = 1
-            self.state.current_word_index = 0
+            self._set_current_word(0)
 
             # Build initial message
-            first_clue = self._get_clue(0)
+            first_clue = self.state.current_clue
             game_type = "bonus puzzle" if is_bonus else "daily puzzle"
-            message = f"Let's play the {game_type}! Word 1 of 5. {first_clue}"
+            message = _MSG_START.format(game_type=game_type, clue=first_clue)
             self.state.last_message = message
 
             return {
@@ -203,45 +329,21 @@ class GameManager:
         """
         answer = answer.strip().upper()
 
-        # NATO phonetic alphabet mapping
-        nato_alphabet = {
-            "ALPHA": "A", "ALFA": "A", "BRAVO": "B", "CHARLIE": "C",
-            "DELTA": "D", "ECHO": "E", "FOXTROT": "F", "GOLF": "G",
-            "HOTEL": "H", "INDIA": "I", "JULIET": "J", "JULIETT": "J",
-            "KILO": "K", "LIMA": "L", "MIKE": "M", "NOVEMBER": "N",
-            "OSCAR": "O", "PAPA": "P", "QUEBEC": "Q", "ROMEO": "R",
-            "SIERRA": "S", "TANGO": "T", "UNIFORM": "U", "VICTOR": "V",
-            "WHISKEY": "W", "WHISKY": "W", "XRAY": "X", "X-RAY": "X",
-            "YANKEE": "Y", "ZULU": "Z",
-        }
+        # Plain single words (the common case) have no separators to parse
+        if answer.isalpha():
+            return answer
 
-        # Check if it looks like NATO phonetic (multiple words, each is a NATO word)
-        words = answer.split()
-        if len(words) > 1:
-            nato_result = []
-            is_nato = True
-            for word in words:
-                word_clean = word.strip(".,!?")
-                if word_clean in nato_alphabet:
-                    nato_result.append(nato_alphabet[word_clean])
-                elif len(word_clean) == 1 and word_clean.isalpha():
-                    # Single letter is okay too
-                    nato_result.append(word_clean)
-                else:
-                    is_nato = False
-                    break
-            if is_nato and nato_result:
-                return "".join(nato_result)
+        # Check if it looks like NATO phonetic (multiple words, each is a NATO word
+        # or a single letter)
+        if _NATO_SPELLING_RE.fullmatch(answer):
+            return "".join(
+                _NATO_ALPHABET.get(word, word) for word in _NATO_WORD_RE.findall(answer)
+            )
 
         # Check for spelled-out pattern: single letters separated by dashes, spaces, or dots
         # Pattern: "S-I-G-H-T" or "S I G H T" or "S.I.G.H.T"
-        # First, normalize separators to spaces
-        normalized = answer.replace("-", " ").replace(".", " ")
-        parts = normalized.split()
-
-        # If all parts are single letters, join them
-        if len(parts) > 1 and all(len(p) == 1 and p.isalpha() for p in parts):
-            return "".join(parts)
+        if _SPELLED_RE.fullmatch(answer):
+            return "".join(answer.translate(_STRIP_DOTS_DASHES).split())
 
         # Return original (already uppercased and stripped)
         return answer
@@ -267,6 +369,23 @@ class GameManager:
         """Submit a word answer."""
         word_index = self.state.current_word_index
 
+        # Reject answers of the wrong length locally, saving a round trip
+        # (and a server-side attempt) on misheard words
+        words_data = self.state.words_data
+        expected = words_data[word_index].get("length") if 0 <= word_index < len(words_data) else None
+        if expected and len(answer) != expected:
+            letter_count = len(answer.translate(_STRIP_NON_LETTERS))
+            if letter_count != expected:
+                message = _MSG_WRONG_LENGTH.format(count=letter_count, expected=expected)
+                self.state.last_message = message
+                return {
+                    "success": True,
+                    "correct": False,
+                    "message": message,
+                    "blanks": self.get_current_blanks(),
+                    "clue": self.state.current_clue,
+                }
+
         try:
             result = await self._api.check_word(
                 self.state.puzzle_id,
@@ -280,14 +399,22 @@ class GameManager:
             if is_correct:
                 if not already_solved:
                     # Update state
-                    if word_index not in self.state.solved_words:
-                        self.state.solved_words.append(word_index)
+                    newly_solved = word_index not in self.state.solved_words
+                    if newly_solved:
+                        self.state.solved_words[word_index] = None
+                        bisect.insort(self.state.solved_sorted, word_index)
+                        self.state.solved_mask |= 1 << word_index
+                        self.state.solved_words_score += _word_points(
+                            self.state.revealed_letters.get(word_index, 0).bit_count()
+                        )
 
                     # Update reveals based on words solved (earn 1 reveal per word)
                     self.state.reveals_available = BASE_REVEALS + len(self.state.solved_words)
 
                     # Update word display to show the correct answer
                     self.state.word_displays[word_index] = answer.upper()
+                    if newly_solved:
+                        self.state.solved_words_display.append(answer.upper())
 
                 # Check if all words solved
                 if len(self.state.solved_words) >= WORDS_PER_PUZZLE:
@@ -296,10 +423,12 @@ class GameManager:
                 # Move to next unsolved word
                 next_word = self._find_next_unsolved_word()
                 if next_word is not None:
-                    self.state.current_word_index = next_word
-                    clue = self._get_clue(next_word)
+                    self._set_current_word(next_word)
+                    clue = self.state.current_clue
                     words_solved = len(self.state.solved_words)
-                    message = f"Correct! {words_solved} of 5 words solved. Word {next_word + 1}. {clue}"
+                    message = _MSG_CORRECT.format(
+                        solved=words_solved, number=next_word + 1, clue=clue
+                    )
                     self.state.last_message = message
                     return {
                         "success": True,
@@ -403,19 +532,8 @@ class GameManager:
 
     def _calculate_current_score(self) -> int:
         """Calculate estimated score based on words solved and reveals used."""
-        # Scoring per word based on reveals used:
-        # 0 reveals = 20 points, 1 reveal = 15, 2 reveals = 10, 3+ reveals = 5
-        score = 0
-        for word_idx in self.state.solved_words:
-            reveals_used = len(self.state.revealed_letters.get(word_idx, []))
-            if reveals_used == 0:
-                score += 20
-            elif reveals_used == 1:
-                score += 15
-            elif reveals_used == 2:
-                score += 10
-            else:
-                score += 5
+        # Word points are added up as words are solved
+        score = self.state.solved_words_score
 
         # Add reveal bonus (5 points per unused reveal)
         unused_reveals = self.state.reveals_available - self.state.reveals_used
@@ -426,7 +544,7 @@ class GameManager:
     async def _transition_to_phase2(self) -> dict[str, Any]:
         """Transition to wager phase after all words solved."""
         self.state.phase = 2
-        self.state.current_word_index = -1
+        self._set_current_word(-1)
 
         # Calculate current score for wager max
         self.state.current_score = self._calculate_current_score()
@@ -434,16 +552,10 @@ class GameManager:
         # Get the solved words for display
         solved_word_names = [
             self.state.word_displays.get(i, "???")
-            for i in sorted(self.state.solved_words)
+            for i in self.state.solved_sorted
         ]
 
-        score = self.state.current_score
-        message = (
-            f"All 5 words solved! Your score so far is {score} points. "
-            f"Time to make your wager! You can bet anywhere from 0 to {score} points on guessing the theme. "
-            f"If you guess correctly, you win your wager. If you're wrong, you lose it. "
-            f"Say 'wager' followed by a number, 'no wager' to play it safe, or 'all in' to risk all {score} points!"
-        )
+        message = _MSG_WAGER_PROMPT.format(score=self.state.current_score)
         self.state.last_message = message
 
         return {
@@ -471,25 +583,20 @@ class GameManager:
         # Transition to theme phase
         self.state.phase = 3
 
-        # Get the solved words for display
-        solved_word_names = [
-            self.state.word_displays.get(i, "???")
-            for i in sorted(self.state.solved_words)
-        ]
-
         if points == 0:
-            wager_msg = "No wager. You'll keep your current score no matter what."
+            wager_msg = _MSG_NO_WAGER
         elif points == max_wager:
-            wager_msg = f"All in with {points} points! Get it right to double up, wrong and you lose it all!"
+            wager_msg = _MSG_ALL_IN.format(points=points)
         else:
-            wager_msg = f"Wagering {points} points. Get it right to win {points} more, wrong and you lose {points}."
+            wager_msg = _MSG_WAGERING.format(points=points)
 
         # Build theme hint
-        theme_hint = ""
         if self.state.theme_word_count > 1:
-            theme_hint = f" The theme is {self.state.theme_word_count} words, {self.state.theme_length} letters total."
+            theme_hint = _MSG_THEME_WORDS.format(
+                words=self.state.theme_word_count, length=self.state.theme_length
+            )
         else:
-            theme_hint = f" The theme is {self.state.theme_length} letters."
+            theme_hint = _MSG_THEME_LETTERS.format(length=self.state.theme_length)
 
         message = f"{wager_msg}{theme_hint} What's the theme?"
         self.state.last_message = message
@@ -507,19 +614,18 @@ class GameManager:
     ) -> dict[str, Any]:
         """End the game and submit score."""
         self.state.is_active = False
-        self.state.completed_at = datetime.now()
+        self.state.completed_epoch = time.time()
 
         # Calculate time
         time_seconds = 0
-        if self.state.started_at:
-            delta = self.state.completed_at - self.state.started_at
-            time_seconds = int(delta.total_seconds())
+        if self.state.started_monotonic is not None:
+            time_seconds = int(time.monotonic() - self.state.started_monotonic)
 
         # Build word_results for score submission
         word_results = []
         for i in range(WORDS_PER_PUZZLE):
             solved = i in self.state.solved_words
-            reveals_used = len(self.state.revealed_letters.get(i, []))
+            reveals_used = self.state.revealed_letters.get(i, 0).bit_count()
             word_results.append({"solved": solved, "reveals_used": reveals_used})
 
         # Submit score to API
@@ -597,15 +703,17 @@ class GameManager:
             return {"success": False, "message": "Invalid word"}
 
         word_length = word_data.get("length", 5)
-        revealed = self.state.revealed_letters.get(word_index, [])
+        revealed = self.state.revealed_letters.get(word_index, 0)
 
         # Find an unrevealed letter position
-        available_positions = [i for i in range(word_length) if i not in revealed]
-        if not available_positions:
+        available = ~revealed & ((1 << word_length) - 1)
+        if not available:
             return {"success": False, "message": "All letters already revealed"}
 
         # Pick a random unrevealed position
-        letter_index = random.choice(available_positions)
+        for _ in range(random.randrange(available.bit_count())):
+            available &= available - 1
+        letter_index = _lowest_bit(available)
 
         try:
             result = await self._api.reveal_letter(
@@ -620,10 +728,12 @@ class GameManager:
             self.state.reveals_available = BASE_REVEALS + len(self.state.solved_words)
 
             # Track revealed letter locally
-            if word_index not in self.state.revealed_letters:
-                self.state.revealed_letters[word_index] = []
-            if actual_index not in self.state.revealed_letters[word_index]:
-                self.state.revealed_letters[word_index].append(actual_index)
+            now_revealed = revealed | 1 << actual_index
+            self.state.revealed_letters[word_index] = now_revealed
+            if word_index in self.state.solved_words:
+                self.state.solved_words_score += (
+                    _word_points(now_revealed.bit_count()) - _word_points(revealed.bit_count())
+                )
 
             # Update word display
             self._update_word_display(word_index, actual_index, letter)
@@ -646,12 +756,11 @@ class GameManager:
 
     def _update_word_display(self, word_index: int, position: int, letter: str) -> None:
         """Update the word display with a revealed letter."""
-        current_display = self.state.word_displays.get(word_index, "")
-        chars = current_display.split(" ")
+        letters = self.state.word_letters.get(word_index)
 
-        if position < len(chars):
-            chars[position] = letter.upper()
-            self.state.word_displays[word_index] = " ".join(chars)
+        if letters is not None and position < len(letters):
+            letters[position] = letter.upper()
+            self.state.word_displays[word_index] = " ".join(letters)
 
     def skip_word(self) -> dict[str, Any]:
         """Skip the current word."""
@@ -659,15 +768,17 @@ class GameManager:
             return {"success": False, "message": "Cannot skip now"}
 
         word_index = self.state.current_word_index
-        if word_index not in self.state.skipped_words:
-            self.state.skipped_words.append(word_index)
+        # Re-skipping a word sends it to the back of the queue
+        self.state.skipped_words.pop(word_index, None)
+        self.state.skipped_words[word_index] = None
+        self.state.skipped_mask |= 1 << word_index
 
         # Find next word
         next_word = self._find_next_unsolved_word()
         if next_word is not None:
-            self.state.current_word_index = next_word
-            clue = self._get_clue(next_word)
-            message = f"Skipped. Word {next_word + 1} of 5. {clue}"
+            self._set_current_word(next_word)
+            clue = self.state.current_clue
+            message = _MSG_SKIPPED.format(number=next_word + 1, clue=clue)
             self.state.last_message = message
             return {
                 "success": True,
@@ -679,9 +790,9 @@ class GameManager:
             # All words either solved or skipped - go back to first skipped
             if self.state.skipped_words:
                 first_skipped = min(self.state.skipped_words)
-                self.state.current_word_index = first_skipped
-                clue = self._get_clue(first_skipped)
-                message = f"Back to word {first_skipped + 1}. {clue}"
+                self._set_current_word(first_skipped)
+                clue = self.state.current_clue
+                message = _MSG_BACK_TO_WORD.format(number=first_skipped + 1, clue=clue)
                 self.state.last_message = message
                 return {
                     "success": True,
@@ -706,10 +817,15 @@ class GameManager:
             return self.state.words_data[word_index].get("clue", "No clue")
         return "No clue"
 
+    def _set_current_word(self, word_index: int) -> None:
+        """Move to a word and cache its clue."""
+        self.state.current_word_index = word_index
+        self.state.current_clue = self._get_clue(word_index)
+
     def get_current_clue(self) -> str:
         """Get the current clue."""
         if self.state.phase == 1:
-            return self._get_clue(self.state.current_word_index)
+            return self.state.current_clue
         return "Guess the theme that connects all the words!"
 
     def get_current_blanks(self) -> str:
@@ -723,23 +839,25 @@ class GameManager:
 
     def _find_next_unsolved_word(self) -> int | None:
         """Find the next unsolved, unskipped word."""
-        current = self.state.current_word_index
-        total = len(self.state.words_data)
-
-        # Look forward from current position
-        for i in range(current + 1, total):
-            if i not in self.state.solved_words and i not in self.state.skipped_words:
-                return i
-
-        # Wrap around to beginning
-        for i in range(0, current):
-            if i not in self.state.solved_words and i not in self.state.skipped_words:
-                return i
-
-        # Check skipped words
-        for i in self.state.skipped_words:
-            if i not in self.state.solved_words:
+        state = self.state
+        current = state.current_word_index
+        open_words = (1 << len(state.words_data)) - 1
+        open_words &= ~(state.solved_mask | state.skipped_mask | (1 << current))
+
+        if open_words:
+            # Look forward from current position, then wrap around
+            ahead = open_words >> (current + 1)
+            if ahead:
+                return current + _lowest_bit(ahead) + 1
+            return _lowest_bit(open_words)
+
+        # Check skipped words, in the order they were skipped; the current
+        # word is only offered again when no other skipped word is left
+        for i in state.skipped_words:
+            if i != current and not state.solved_mask >> i & 1:
                 return i
+        if current in state.skipped_words and not state.solved_mask >> current & 1:
+            return current
 
         return None
 
@@ -753,7 +871,7 @@ class GameManager:
         # Get solved word names
         solved_word_names = [
             self.state.word_displays.get(i, "???")
-            for i in sorted(self.state.solved_words)
+            for i in self.state.solved_sorted
         ]
 
         message = f"Game over. You solved {len(self.state.solved_words)} of 5 words."
@@ -767,7 +885,7 @@ class GameManager:
     def start_spelling(self) -> dict[str, Any]:
         """Enter spelling mode."""
         self.spelling_mode = True
-        self.spelling_buffer = []
+        self.spelling_buffer = ""
         message = "Spelling mode. Say each letter, then say 'done' when finished."
         self.state.last_message = message
         return {"success": True, "message": message}
@@ -776,32 +894,36 @@ class GameManager:
         """Add a letter to the spelling buffer."""
         letter = letter.strip().upper()
         if len(letter) == 1 and letter.isalpha():
-            self.spelling_buffer.append(letter)
+            self.spelling_buffer += letter
             spelled = " ".join(self.spelling_buffer)
             message = f"Spelled so far: {spelled}"
             self.state.last_message = message
-            return {"success": True, "message": message, "buffer": self.spelling_buffer}
+            return {"success": True, "message": message, "buffer": list(self.spelling_buffer)}
         return {"success": False, "message": "Invalid letter"}
 
     async def finish_spelling(self, text: str | None = None) -> dict[str, Any]:
         """Finish spelling and submit the word."""
         if text:
             # Parse letters from spoken text
-            self.spelling_buffer = [c.upper() for c in text if c.isalpha()]
-
-        if not self.spelling_buffer:
+            letters = text.upper().translate(_STRIP_NON_LETTERS)
+            if not letters.isalpha():
+                # Non-ASCII punctuation left over, filter the slow way
+                letters = "".join(c for c in letters if c.isalpha())
+            self.spelling_buffer = letters
+
+        word = self.spelling_buffer
+        if not word:
             return {"success": False, "message": "Nothing spelled"}
 
-        word = "".join(self.spelling_buffer)
         self.spelling_mode = False
-        self.spelling_buffer = []
+        self.spelling_buffer = ""
 
         return await self.submit_answer(word)
 
     def cancel_spelling(self) -> dict[str, Any]:
         """Cancel spelling mode."""
         self.spelling_mode = False
-        self.spelling_buffer = []
+        self.spelling_buffer = ""
         clue = self.get_current_clue()
         message = f"Spelling cancelled. {clue}"
         self.state.last_message = message
@@ -826,15 +948,10 @@ class GameManager:
         self.timeout_count += 1
 
         if self.timeout_count >= 3:
-            message = "I'll pause the game. Say 'continue puzzle game' when ready."
             self.session_active = False
-            return {"message": message, "timeout_count": self.timeout_count, "should_pause": True}
-        elif self.timeout_count == 2:
-            clue = self.get_current_clue()
-            message = f"Take your time. {clue}"
-        else:
-            clue = self.get_current_clue()
-            message = f"Still thinking? {clue}"
+            return {"message": _MSG_TIMEOUT_PAUSE, "timeout_count": self.timeout_count, "should_pause": True}
+
+        message = _TIMEOUT_PREFIXES[self.timeout_count - 1] + self.get_current_clue()
 
         self.state.last_message = message
         return {"message": message, "timeout_count": self.timeout_count, "should_retry": True}
@@ -36,6 +36,32 @@ from .coordinator import PuzzleGameCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor attribute name -> coordinator data key
+_ATTR_MAP: tuple[tuple[str, str], ...] = (
+    (ATTR_GAME_ID, "game_id"),
+    (ATTR_SESSION_ID, "session_id"),
+    (ATTR_PHASE, "phase"),
+    (ATTR_WORD_NUMBER, "word_number"),
+    (ATTR_SCORE, "score"),
+    (ATTR_REVEALS, "reveals"),
+    (ATTR_BLANKS, "blanks"),
+    (ATTR_CLUE, "clue"),
+    (ATTR_SOLVED_WORDS, "solved_words"),
+    ("solved_word_indices", "solved_word_indices"),
+    ("skipped_word_indices", "skipped_word_indices"),
+    (ATTR_IS_ACTIVE, "is_active"),
+    (ATTR_LAST_MESSAGE, "last_message"),
+    (ATTR_THEME_REVEALED, "theme_revealed"),
+    (ATTR_SESSION_ACTIVE, "session_active"),
+    (ATTR_ACTIVE_SATELLITE, "active_satellite"),
+    (ATTR_VIEW_ASSIST_DEVICE, "view_assist_device"),
+    (ATTR_SPELLING_MODE, "spelling_mode"),
+    (ATTR_SPELLING_BUFFER, "spelling_buffer"),
+    (ATTR_CURRENT_SCORE, "current_score"),
+    ("pending_theme_guess", "pending_theme_guess"),
+    ("awaiting_theme_confirmation", "awaiting_theme_confirmation"),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -67,52 +93,45 @@ class PuzzleGameSensor(CoordinatorEntity, SensorEntity):
             "manufacturer": "Puzzle Game Online",
             "model": "Game State",
         }
+        # (coordinator state_version, native value, attributes)
+        self._cache: tuple[int, str, dict[str, Any]] | None = None
+        self._written_version: int | None = None
+
+    def _get_cache(self) -> tuple[int, str, dict[str, Any]]:
+        """Return the cached value and attributes for the current state."""
+        version = self.coordinator.state_version
+        if self._cache is None or self._cache[0] != version:
+            state = self.coordinator.data
+            if state.get("is_active"):
+                value = state.get("clue", "Playing...")
+            else:
+                value = "Ready to play"
+            attrs = {attr: state.get(key) for attr, key in _ATTR_MAP}
+            self._cache = (version, value, attrs)
+        return self._cache
 
     @property
     def native_value(self) -> str:
         """Return the current clue or status."""
-        state = self.coordinator.game_state
-        if state.get("is_active"):
-            return state.get("clue", "Playing...")
-        return "Ready to play"
+        return self._get_cache()[1]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return state attributes."""
-        state = self.coordinator.game_state
-        return {
-            ATTR_GAME_ID: state.get("game_id"),
-            ATTR_SESSION_ID: state.get("session_id"),
-            ATTR_PHASE: state.get("phase"),
-            ATTR_WORD_NUMBER: state.get("word_number"),
-            ATTR_SCORE: state.get("score"),
-            ATTR_REVEALS: state.get("reveals"),
-            ATTR_BLANKS: state.get("blanks"),
-            ATTR_CLUE: state.get("clue"),
-            ATTR_SOLVED_WORDS: state.get("solved_words"),
-            "solved_word_indices": state.get("solved_word_indices"),
-            "skipped_word_indices": state.get("skipped_word_indices"),
-            ATTR_IS_ACTIVE: state.get("is_active"),
-            ATTR_LAST_MESSAGE: state.get("last_message"),
-            ATTR_THEME_REVEALED: state.get("theme_revealed"),
-            ATTR_SESSION_ACTIVE: state.get("session_active"),
-            ATTR_ACTIVE_SATELLITE: state.get("active_satellite"),
-            ATTR_VIEW_ASSIST_DEVICE: state.get("view_assist_device"),
-            ATTR_SPELLING_MODE: state.get("spelling_mode"),
-            ATTR_SPELLING_BUFFER: state.get("spelling_buffer"),
-            ATTR_CURRENT_SCORE: state.get("current_score"),
-            "pending_theme_guess": state.get("pending_theme_guess"),
-            "awaiting_theme_confirmation": state.get("awaiting_theme_confirmation"),
-        }
+        return self._get_cache()[2]
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        if self.coordinator.game_state.get("is_active"):
+        if self._get_cache()[2][ATTR_IS_ACTIVE]:
             return "mdi:puzzle"
         return "mdi:puzzle-outline"
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        version = self.coordinator.state_version
+        if version == self._written_version:
+            return
+        self._written_version = version
         self.async_write_ha_state()